@@ -0,0 +1,54 @@
+"""
+JSON-RPC helpers shared by the comprehensive example clients.
+"""
+
+import json
+from functools import lru_cache
+from typing import Any, Dict, Tuple
+
+try:
+    import orjson
+
+    json_dumps = orjson.dumps
+    json_loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the stdlib
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+    json_loads = json.loads
+
+
+# Sent on every request; bound once as the shared client's default headers.
+# Streamable HTTP servers require clients to accept both JSON and SSE replies.
+# Accept-Encoding is left to httpx: it already advertises gzip/deflate (plus br
+# or zstd when those decoders are installed) and decompresses listing replies.
+DEFAULT_HEADERS = {
+    "Content-Type": "application/json",
+    "Accept": "application/json, text/event-stream",
+}
+
+
+@lru_cache(maxsize=None)
+def api_key_headers(api_key: str) -> Dict[str, str]:
+    """Per-request headers for an API key, built once and reused (do not mutate)."""
+    return {"X-API-Key": api_key}
+
+
+def parse_rpc(response: dict) -> Tuple[bool, Any, str]:
+    """
+    Split a JSON-RPC response into its outcome.
+
+    Args:
+        response: Decoded JSON-RPC response object
+
+    Returns:
+        (ok, payload, error) - ``payload`` is the result member when ``ok``;
+        ``error`` is the error message when the server returned one. A response
+        with neither member comes back as ``(False, response, "")``.
+    """
+    if "result" in response:
+        return True, response["result"], ""
+    if "error" in response:
+        error = response["error"]
+        return False, None, error.get("message", str(error)) if isinstance(error, dict) else str(error)
+    return False, response, ""
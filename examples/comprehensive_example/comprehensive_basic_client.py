@@ -7,59 +7,138 @@ and test different authorization levels.
 """
 
 import asyncio
+import importlib.util
+import itertools
+import sys
 import httpx
 import json
+from typing import Callable, Dict, List, NamedTuple, Tuple
 
+from _rpc import DEFAULT_HEADERS, api_key_headers, json_dumps, json_loads, parse_rpc
 
-async def test_capability(server_url: str, api_key: str, method: str, params: dict, description: str):
-    """Test a single MCP capability."""
-    headers = {
-        "Content-Type": "application/json",
-        "X-API-Key": api_key
-    }
+# HTTP/2 multiplexes concurrent calls over one connection; needs the optional h2 package
+HTTP2_ENABLED = importlib.util.find_spec("h2") is not None
+
+
+def create_http_client(server_url: str) -> httpx.AsyncClient:
+    """Create the pooled HTTP client shared by all demo requests."""
+    return httpx.AsyncClient(
+        base_url=server_url, headers=DEFAULT_HEADERS, http2=HTTP2_ENABLED, timeout=10.0
+    )
+
+
+def _available_names(result: dict, key: str) -> List[str]:
+    """Render the names (or URIs) listed under ``key`` in a list response."""
+    names = [item.get("name", item.get("uri", "unknown")) for item in result.get(key, [])]
+    return [f"   📋 Available: {names}"]
+
+
+# Per-method renderers for the "result" member of a successful response
+RESPONSE_EXTRACTORS: Dict[str, Callable[[dict], List[str]]] = {
+    "tools/call": lambda r: [f"   📄 Result: {r['content'][0]['text']}"],
+    "resources/read": lambda r: [
+        f"   📄 Content: {r['contents'][0]['text'] if r['contents'] else 'No content'}"
+    ],
+    "prompts/get": lambda r: [f"   📄 Prompt: {r['messages'][0]['content']['text']}"] if r["messages"] else [],
+    "tools/list": lambda r: _available_names(r, "tools"),
+    "resources/list": lambda r: _available_names(r, "resources"),
+    "prompts/list": lambda r: _available_names(r, "prompts"),
+}
+
+
+def describe_result(method: str, result: dict) -> List[str]:
+    """Render a JSON-RPC response for a given MCP method as output lines."""
+    ok, payload, error_msg = parse_rpc(result)
+    if ok:
+        lines = [f"   ✅ Success!"]
+        extractor = RESPONSE_EXTRACTORS.get(method)
+        if extractor is not None:
+            lines.extend(extractor(payload))
+        return lines
     
-    payload = {
+    if error_msg:
+        return [f"   ❌ Access denied: {error_msg}"]
+    
+    return [f"   ⚠️  Unexpected response: {result}"]
+
+
+def describe_request(api_key: str, method: str, description: str) -> List[str]:
+    """Render the header lines printed before each test result."""
+    return [
+        f"\n🧪 {description}",
+        f"   Method: {method}",
+        f"   API Key: {api_key}",
+    ]
+
+
+async def test_capability(client: httpx.AsyncClient, api_key: str, method: str, params: dict, description: str) -> List[str]:
+    """
+    Test a single MCP capability using the shared HTTP client.
+
+    Output lines are collected and returned rather than printed so that
+    concurrently dispatched tests can be reported in scenario order.
+    """
+    content = json_dumps({
         "jsonrpc": "2.0",
         "id": 1,
         "method": method,
         "params": params
-    }
+    })
     
-    print(f"\n🧪 {description}")
-    print(f"   Method: {method}")
-    print(f"   API Key: {api_key}")
+    lines = describe_request(api_key, method, description)
     
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(f"{server_url}/mcp", headers=headers, json=payload)
-            result = response.json()
-            
-            if "result" in result:
-                print(f"   ✅ Success!")
-                if method == "tools/call":
-                    content = result["result"]["content"][0]["text"]
-                    print(f"   📄 Result: {content}")
-                elif method == "resources/read":
-                    content = result["result"]["contents"][0]["text"] if result["result"]["contents"] else "No content"
-                    print(f"   📄 Content: {content}")
-                elif method == "prompts/get":
-                    messages = result["result"]["messages"]
-                    if messages:
-                        print(f"   📄 Prompt: {messages[0]['content']['text']}")
-                elif "list" in method:
-                    items = result["result"].get("tools", result["result"].get("resources", result["result"].get("prompts", [])))
-                    names = [item.get("name", item.get("uri", "unknown")) for item in items]
-                    print(f"   📋 Available: {names}")
-                    
-            elif "error" in result:
-                error = result['error']
-                error_msg = error.get('message', str(error)) if isinstance(error, dict) else str(error)
-                print(f"   ❌ Access denied: {error_msg}")
-            else:
-                print(f"   ⚠️  Unexpected response: {result}")
-                
+        response = await client.post("/mcp", headers=api_key_headers(api_key), content=content)
+        lines.extend(describe_result(method, json_loads(response.content)))
     except Exception as e:
-        print(f"   💥 Request failed: {e}")
+        lines.append(f"   💥 Request failed: {e}")
+    
+    return lines
+
+
+class Scenario(NamedTuple):
+    """One demo request: who sends it, what it calls, and what it shows."""
+    role: str
+    method: str
+    params: dict
+    description: str
+
+
+# Test scenarios, built once at import time
+SCENARIOS: Tuple[Scenario, ...] = (
+    # Tools testing
+    Scenario("admin", "tools/list", {}, "Admin listing all tools"),
+    Scenario("admin", "tools/call", {"name": "delete_user", "arguments": {"user_id": "test123"}}, "Admin deleting user (dangerous operation)"),
+
+    Scenario("user", "tools/list", {}, "User listing available tools"),
+    Scenario("user", "tools/call", {"name": "get_user_info", "arguments": {"user_id": "test123"}}, "User getting user info (allowed)"),
+    Scenario("user", "tools/call", {"name": "delete_user", "arguments": {"user_id": "test123"}}, "User trying to delete user (should fail)"),
+
+    Scenario("public", "tools/call", {"name": "public_info"}, "Public user accessing public info"),
+
+    # Resources testing
+    Scenario("admin", "resources/list", {}, "Admin listing all resources"),
+    Scenario("admin", "resources/read", {"uri": "admin://system"}, "Admin reading system config"),
+
+    Scenario("analyst", "resources/read", {"uri": "api://logs"}, "Analyst reading API logs"),
+    Scenario("analyst", "resources/read", {"uri": "admin://system"}, "Analyst trying to read admin config (should fail)"),
+
+    Scenario("user", "resources/read", {"uri": "user://profile"}, "User reading own profile"),
+    Scenario("user", "resources/read", {"uri": "admin://system"}, "User trying to read admin config (should fail)"),
+
+    Scenario("public", "resources/read", {"uri": "public://docs"}, "Public user reading public docs"),
+    Scenario("public", "resources/read", {"uri": "user://profile"}, "Public user trying to read private profile (should fail)"),
+
+    # Prompts testing
+    Scenario("admin", "prompts/list", {}, "Admin listing all prompts"),
+    Scenario("admin", "prompts/get", {"name": "admin_report", "arguments": {"period": "Q1", "details": "summary"}}, "Admin using admin report prompt"),
+
+    Scenario("analyst", "prompts/get", {"name": "sql_analysis", "arguments": {"sql_query": "SELECT * FROM users"}}, "Analyst using SQL analysis prompt"),
+    Scenario("analyst", "prompts/get", {"name": "admin_report", "arguments": {"period": "Q1", "details": "test"}}, "Analyst trying admin prompt (should fail)"),
+
+    Scenario("user", "prompts/get", {"name": "user_query", "arguments": {"query": "How do I reset my password?"}}, "User using general query prompt"),
+    Scenario("user", "prompts/get", {"name": "sql_analysis", "arguments": {"sql_query": "SELECT 1"}}, "User trying SQL prompt (should fail)"),
+)
 
 
 async def demo_authorization():
@@ -81,47 +160,15 @@ async def demo_authorization():
     print(f"\n🌐 Server URL: {server_url}")
     print(f"🔑 API Keys: {list(api_keys.keys())}")
     
-    # Test scenarios
-    scenarios = [
-        # Tools testing
-        ("admin", "tools/list", {}, "Admin listing all tools"),
-        ("admin", "tools/call", {"name": "delete_user", "arguments": {"user_id": "test123"}}, "Admin deleting user (dangerous operation)"),
-        
-        ("user", "tools/list", {}, "User listing available tools"),
-        ("user", "tools/call", {"name": "get_user_info", "arguments": {"user_id": "test123"}}, "User getting user info (allowed)"),
-        ("user", "tools/call", {"name": "delete_user", "arguments": {"user_id": "test123"}}, "User trying to delete user (should fail)"),
-        
-        ("public", "tools/call", {"name": "public_info"}, "Public user accessing public info"),
-        
-        # Resources testing
-        ("admin", "resources/list", {}, "Admin listing all resources"),
-        ("admin", "resources/read", {"uri": "admin://system"}, "Admin reading system config"),
-        
-        ("analyst", "resources/read", {"uri": "api://logs"}, "Analyst reading API logs"),
-        ("analyst", "resources/read", {"uri": "admin://system"}, "Analyst trying to read admin config (should fail)"),
-        
-        ("user", "resources/read", {"uri": "user://profile"}, "User reading own profile"),
-        ("user", "resources/read", {"uri": "admin://system"}, "User trying to read admin config (should fail)"),
-        
-        ("public", "resources/read", {"uri": "public://docs"}, "Public user reading public docs"),
-        ("public", "resources/read", {"uri": "user://profile"}, "Public user trying to read private profile (should fail)"),
-        
-        # Prompts testing
-        ("admin", "prompts/list", {}, "Admin listing all prompts"),
-        ("admin", "prompts/get", {"name": "admin_report", "arguments": {"period": "Q1", "details": "summary"}}, "Admin using admin report prompt"),
-        
-        ("analyst", "prompts/get", {"name": "sql_analysis", "arguments": {"sql_query": "SELECT * FROM users"}}, "Analyst using SQL analysis prompt"),
-        ("analyst", "prompts/get", {"name": "admin_report", "arguments": {"period": "Q1", "details": "test"}}, "Analyst trying admin prompt (should fail)"),
-        
-        ("user", "prompts/get", {"name": "user_query", "arguments": {"query": "How do I reset my password?"}}, "User using general query prompt"),
-        ("user", "prompts/get", {"name": "sql_analysis", "arguments": {"sql_query": "SELECT 1"}}, "User trying SQL prompt (should fail)"),
-    ]
     
-    # Run test scenarios
-    for role, method, params, description in scenarios:
-        api_key = api_keys[role]
-        await test_capability(server_url, api_key, method, params, description)
-        await asyncio.sleep(0.1)  # Small delay between requests
+    # Run test scenarios concurrently, then report them in scenario order
+    async with create_http_client(server_url) as client:
+        results = await asyncio.gather(*(
+            test_capability(client, api_keys[s.role], s.method, s.params, s.description)
+            for s in SCENARIOS
+        ))
+    
+    sys.stdout.write("\n".join(itertools.chain.from_iterable(results)) + "\n")
     
     print(f"\n🎯 Demo Complete!")
     print("Key takeaways:")
@@ -133,6 +180,11 @@ async def demo_authorization():
     print("✅ Unauthorized access is properly blocked")
 
 
+async def ainput(prompt: str) -> str:
+    """Read a line from stdin in a worker thread so the event loop keeps running."""
+    return await asyncio.to_thread(input, prompt)
+
+
 async def interactive_test():
     """Interactive testing mode."""
     server_url = "http://localhost:8000"
@@ -151,48 +203,56 @@ async def interactive_test():
     print("Type 'quit' to exit")
     print()
     
-    while True:
-        try:
-            # Get role
-            role = input("Enter role (admin/analyst/user/public): ").strip().lower()
-            if role == "quit":
-                break
-            if role not in api_keys:
-                print("Invalid role!")
-                continue
+    async with create_http_client(server_url) as client:
+        while True:
+            try:
+                # Get role
+                role = (await ainput("Enter role (admin/analyst/user/public): ")).strip().lower()
+                if role == "quit":
+                    break
+                if role not in api_keys:
+                    print("Invalid role!")
+                    continue
                 
-            # Get method
-            method = input("Enter method (e.g., tools/list, tools/call): ").strip()
-            if method == "quit":
-                break
+                # Get method
+                method = (await ainput("Enter method (e.g., tools/list, tools/call): ")).strip()
+                if method == "quit":
+                    break
                 
-            # Get parameters (optional)
-            params_str = input("Enter params as JSON (or press Enter for {}): ").strip()
-            if params_str == "quit":
-                break
+                # Get parameters (optional)
+                params_str = (await ainput("Enter params as JSON (or press Enter for {}): ")).strip()
+                if params_str == "quit":
+                    break
                 
-            params = {}
-            if params_str:
-                try:
-                    params = json.loads(params_str)
-                except json.JSONDecodeError:
-                    print("Invalid JSON! Using empty params.")
+                params = {}
+                if params_str:
+                    try:
+                        params = json.loads(params_str)
+                    except json.JSONDecodeError:
+                        print("Invalid JSON! Using empty params.")
             
-            # Make the request
-            api_key = api_keys[role]
-            await test_capability(server_url, api_key, method, params, f"{role} calling {method}")
-            print()
+                # Make the request
+                api_key = api_keys[role]
+                lines = await test_capability(client, api_key, method, params, f"{role} calling {method}")
+                print("\n".join(lines))
+                print()
             
-        except KeyboardInterrupt:
-            print("\nExiting...")
-            break
-        except EOFError:
-            print("\nExiting...")
-            break
+            except KeyboardInterrupt:
+                print("\nExiting...")
+                break
+            except EOFError:
+                print("\nExiting...")
+                break
 
 
 if __name__ == "__main__":
-    import sys
+    # uvloop is optional and unavailable on Windows; use it when present
+    if sys.platform != "win32":
+        try:
+            import uvloop
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        except ImportError:
+            pass
     
     if len(sys.argv) > 1 and sys.argv[1] == "interactive":
         asyncio.run(interactive_test())
@@ -11,81 +11,165 @@ Tests different user roles and their access levels.
 """
 
 import asyncio
+import importlib.util
+import os
 import sys
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Dict, List, Optional
 import httpx
 import json
 
+from _rpc import DEFAULT_HEADERS, api_key_headers, json_dumps, json_loads, parse_rpc
+
+# HTTP/2 multiplexes concurrent calls over one connection; needs the optional h2 package
+HTTP2_ENABLED = importlib.util.find_spec("h2") is not None
+
+
+@lru_cache(maxsize=None)
+def encode_bare_request(method: str) -> bytes:
+    """Encode a parameterless request (e.g. the listing probes) once per method."""
+    return json_dumps({"jsonrpc": "2.0", "id": 1, "method": method, "params": {}})
+
+
+# A short connect timeout makes the first request double as the liveness check
+CLIENT_TIMEOUT = httpx.Timeout(10.0, connect=1.0)
+
+# Raised out of requests (instead of folded into an error response) so callers can stop early
+CONNECT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout)
+
+# Role to API key mapping
+API_KEYS = MappingProxyType({
+    "admin": "admin-key-123",
+    "analyst": "analyst-key-456",
+    "user": "user-key-789",
+    "public": "public-key-000"
+})
+
+# Every capability the comprehensive server exposes, in display order
+ALL_CAPABILITIES = MappingProxyType({
+    "tools": ("get_user_info", "delete_user", "query_database", "public_info"),
+    "resources": ("user://profile", "public://docs", "admin://system", "api://logs"),
+    "prompts": ("user_query", "admin_report", "sql_analysis"),
+})
+
+# Expected capabilities for each role
+ROLE_EXPECTATIONS = MappingProxyType({
+    "admin": MappingProxyType({
+        "tools": ("get_user_info", "delete_user", "query_database", "public_info"),
+        "resources": ("user://profile", "public://docs", "admin://system", "api://logs"),
+        "prompts": ("user_query", "admin_report", "sql_analysis")
+    }),
+    "analyst": MappingProxyType({
+        "tools": ("get_user_info", "query_database", "public_info"),
+        "resources": ("public://docs", "api://logs"),
+        "prompts": ("sql_analysis",)
+    }),
+    "user": MappingProxyType({
+        "tools": ("get_user_info", "public_info"),
+        "resources": ("user://profile", "public://docs"),
+        "prompts": ("user_query",)
+    }),
+    "public": MappingProxyType({
+        "tools": ("public_info",),
+        "resources": ("public://docs",),
+        "prompts": ()
+    })
+})
+
+# Capabilities each role must not reach, precomputed from the tables above
+FORBIDDEN = MappingProxyType({
+    role: MappingProxyType({
+        kind: tuple(c for c in everything if c not in expected[kind])
+        for kind, everything in ALL_CAPABILITIES.items()
+    })
+    for role, expected in ROLE_EXPECTATIONS.items()
+})
+
+
+# Arguments used when exercising each allowed tool / prompt
+TOOL_ARGS = MappingProxyType({
+    "get_user_info": {"user_id": "test123"},
+    "delete_user": {"user_id": "test123"},
+    "query_database": {"sql": "SELECT * FROM users"},
+})
+
+PROMPT_ARGS = MappingProxyType({
+    "user_query": {"query": "test question"},
+    "admin_report": {"period": "Q1", "details": "summary"},
+    "sql_analysis": {"sql_query": "SELECT * FROM test"},
+})
+
 
 class ComprehensiveTestClient:
     """Test client for comprehensive MCP server capabilities."""
     
-    def __init__(self, server_url: str = "http://localhost:8000"):
+    def __init__(self, server_url: str = "http://localhost:8000", max_concurrency: Optional[int] = None):
         self.server_url = server_url.rstrip("/")
         self.mcp_url = f"{self.server_url}/mcp"
+        self._client: Optional[httpx.AsyncClient] = None
+        
+        # Report lines are buffered and written once per role rather than printed inline
+        self._output: List[str] = []
         
-        # Role to API key mapping
-        self.api_keys = {
-            "admin": "admin-key-123",
-            "analyst": "analyst-key-456", 
-            "user": "user-key-789",
-            "public": "public-key-000"
-        }
+        # Cap in-flight requests so gathered probes don't overload the server
+        self.max_concurrency = max_concurrency or (os.cpu_count() or 8) * 2
+        self._sem = asyncio.Semaphore(self.max_concurrency)
         
-        # Expected capabilities for each role
-        self.role_expectations = {
-            "admin": {
-                "tools": ["get_user_info", "delete_user", "query_database", "public_info"],
-                "resources": ["user://profile", "public://docs", "admin://system", "api://logs"],
-                "prompts": ["user_query", "admin_report", "sql_analysis"]
-            },
-            "analyst": {
-                "tools": ["get_user_info", "query_database", "public_info"],
-                "resources": ["public://docs", "api://logs"],
-                "prompts": ["sql_analysis"]
-            },
-            "user": {
-                "tools": ["get_user_info", "public_info"],
-                "resources": ["user://profile", "public://docs"],
-                "prompts": ["user_query"]
-            },
-            "public": {
-                "tools": ["public_info"],
-                "resources": ["public://docs"],
-                "prompts": []
-            }
-        }
+        self.api_keys = API_KEYS
+        self.role_expectations = ROLE_EXPECTATIONS
+
+    async def __aenter__(self) -> "ComprehensiveTestClient":
+        """Open one pooled HTTP client shared by every request."""
+        self._client = httpx.AsyncClient(
+            base_url=self.server_url,
+            headers=DEFAULT_HEADERS,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+            http2=HTTP2_ENABLED,
+            timeout=CLIENT_TIMEOUT,
+        )
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def make_mcp_request(self, method: str, params: dict, api_key: str) -> dict:
         """Make an MCP request with authentication."""
-        headers = {
-            "Content-Type": "application/json",
-            "X-API-Key": api_key
-        }
-        
-        payload = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": method,
-            "params": params
-        }
+        if params:
+            content = json_dumps({
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": method,
+                "params": params
+            })
+        else:
+            content = encode_bare_request(method)
         
-        async with httpx.AsyncClient() as client:
+        async with self._sem:
             try:
-                response = await client.post(self.mcp_url, headers=headers, json=payload)
-                return response.json()
+                response = await self._client.post("/mcp", headers=api_key_headers(api_key), content=content)
+                return json_loads(response.content)
+            except CONNECT_ERRORS:
+                raise
             except Exception as e:
                 return {"error": f"Request failed: {e}"}
 
-    async def test_tools_listing(self, role: str) -> List[str]:
-        """Test tools listing for a role."""
+    async def _list_capabilities(self, role: str, method: str, key: str, field: str) -> List[str]:
+        """Run a listing probe for a role and collect the listed names."""
         api_key = self.api_keys[role]
-        response = await self.make_mcp_request("tools/list", {}, api_key)
+        response = await self.make_mcp_request(method, {}, api_key)
         
-        if "result" in response and "tools" in response["result"]:
-            return [tool["name"] for tool in response["result"]["tools"]]
+        if "result" in response and key in response["result"]:
+            return [item[field] for item in response["result"][key]]
         return []
 
+    async def test_tools_listing(self, role: str) -> List[str]:
+        """Test tools listing for a role."""
+        return await self._list_capabilities(role, "tools/list", "tools", "name")
+
     async def test_tool_execution(self, role: str, tool_name: str, arguments: dict = None) -> dict:
         """Test tool execution for a role."""
         api_key = self.api_keys[role]
@@ -98,12 +182,7 @@ class ComprehensiveTestClient:
 
     async def test_resources_listing(self, role: str) -> List[str]:
         """Test resources listing for a role."""
-        api_key = self.api_keys[role]
-        response = await self.make_mcp_request("resources/list", {}, api_key)
-        
-        if "result" in response and "resources" in response["result"]:
-            return [resource["uri"] for resource in response["result"]["resources"]]
-        return []
+        return await self._list_capabilities(role, "resources/list", "resources", "uri")
 
     async def test_resource_reading(self, role: str, resource_uri: str) -> dict:
         """Test resource reading for a role."""
@@ -114,12 +193,7 @@ class ComprehensiveTestClient:
 
     async def test_prompts_listing(self, role: str) -> List[str]:
         """Test prompts listing for a role."""
-        api_key = self.api_keys[role]
-        response = await self.make_mcp_request("prompts/list", {}, api_key)
-        
-        if "result" in response and "prompts" in response["result"]:
-            return [prompt["name"] for prompt in response["result"]["prompts"]]
-        return []
+        return await self._list_capabilities(role, "prompts/list", "prompts", "name")
 
     async def test_prompt_usage(self, role: str, prompt_name: str, arguments: dict = None) -> dict:
         """Test prompt usage for a role."""
@@ -132,148 +206,167 @@ class ComprehensiveTestClient:
         return response
 
     def print_result(self, success: bool, message: str, details: str = ""):
-        """Print formatted test result."""
+        """Buffer a formatted test result for the next flush_output()."""
         icon = "✅" if success else "❌"
-        print(f"   {icon} {message}")
+        self._output.append(f"   {icon} {message}")
         if details:
-            print(f"      {details}")
+            self._output.append(f"      {details}")
+
+    def flush_output(self):
+        """Write all buffered report lines to stdout in a single call."""
+        if self._output:
+            sys.stdout.write("\n".join(self._output) + "\n")
+            self._output.clear()
 
     async def test_role_capabilities(self, role: str):
         """Comprehensively test all capabilities for a role."""
-        print(f"\n🧪 Testing role: {role.upper()}")
-        print("=" * 50)
+        self._output.append(f"\n🧪 Testing role: {role.upper()}")
+        self._output.append("=" * 50)
         
         expected = self.role_expectations[role]
         
         # Test Tools
-        print(f"\n🔧 Testing Tools Access for {role}")
-        print("-" * 30)
+        self._output.append(f"\n🔧 Testing Tools Access for {role}")
+        self._output.append("-" * 30)
         
         # List tools
         available_tools = await self.test_tools_listing(role)
         expected_tools = expected["tools"]
         
-        print(f"   📋 Available tools: {available_tools}")
+        self._output.append(f"   📋 Available tools: {available_tools}")
+        
+        # Test expected tools, executing every visible one concurrently
+        visible_tools = [t for t in expected_tools if t in available_tools]
+        results = await asyncio.gather(*(
+            self.test_tool_execution(role, tool, TOOL_ARGS.get(tool)) for tool in visible_tools
+        ))
+        tool_results = dict(zip(visible_tools, results))
         
-        # Test expected tools
         for tool in expected_tools:
-            if tool in available_tools:
-                # Test execution
-                if tool == "get_user_info":
-                    result = await self.test_tool_execution(role, tool, {"user_id": "test123"})
-                elif tool == "delete_user":
-                    result = await self.test_tool_execution(role, tool, {"user_id": "test123"})
-                elif tool == "query_database":
-                    result = await self.test_tool_execution(role, tool, {"sql": "SELECT * FROM users"})
-                else:
-                    result = await self.test_tool_execution(role, tool)
-                
-                if "result" in result:
-                    self.print_result(True, f"Can execute {tool}", f"Result: {result['result']['content'][0]['text'][:50]}...")
-                elif "error" in result:
-                    error_msg = result['error'].get('message', str(result['error'])) if isinstance(result['error'], dict) else str(result['error'])
+            if tool in tool_results:
+                ok, payload, error_msg = parse_rpc(tool_results[tool])
+                if ok:
+                    self.print_result(True, f"Can execute {tool}", f"Result: {payload['content'][0]['text'][:50]}...")
+                elif error_msg:
                     self.print_result(False, f"Cannot execute {tool}", f"Error: {error_msg}")
             else:
                 self.print_result(False, f"Cannot see {tool}", "Not in available tools")
         
         # Test forbidden tools
-        all_tools = ["get_user_info", "delete_user", "query_database", "public_info"]
-        forbidden_tools = [t for t in all_tools if t not in expected_tools]
+        forbidden_tools = FORBIDDEN[role]["tools"]
+        
+        # Tools that are visible but should fail execution
+        leaked_tools = [t for t in forbidden_tools if t in available_tools]
+        results = await asyncio.gather(*(
+            self.test_tool_execution(role, tool, {"user_id": "test"} if "user" in tool else {})
+            for tool in leaked_tools
+        ))
+        tool_results = dict(zip(leaked_tools, results))
         
         for tool in forbidden_tools:
-            if tool not in available_tools:
+            if tool not in tool_results:
                 self.print_result(True, f"Correctly blocked from {tool}", "Not visible in listings")
             else:
-                # Tool is visible but should fail execution
-                result = await self.test_tool_execution(role, tool, {"user_id": "test"} if "user" in tool else {})
-                if "error" in result:
-                    error_msg = result['error'].get('message', str(result['error'])) if isinstance(result['error'], dict) else str(result['error'])
+                _, _, error_msg = parse_rpc(tool_results[tool])
+                if error_msg:
                     self.print_result(True, f"Correctly blocked from executing {tool}", f"Error: {error_msg}")
                 else:
                     self.print_result(False, f"Unexpectedly allowed to execute {tool}", "Should have been blocked")
 
         # Test Resources
-        print(f"\n📁 Testing Resources Access for {role}")
-        print("-" * 30)
+        self._output.append(f"\n📁 Testing Resources Access for {role}")
+        self._output.append("-" * 30)
         
         available_resources = await self.test_resources_listing(role)
         expected_resources = expected["resources"]
         
-        print(f"   📋 Available resources: {available_resources}")
+        self._output.append(f"   📋 Available resources: {available_resources}")
         
         # Test expected resources
+        visible_resources = [r for r in expected_resources if r in available_resources]
+        results = await asyncio.gather(*(
+            self.test_resource_reading(role, resource) for resource in visible_resources
+        ))
+        resource_results = dict(zip(visible_resources, results))
+        
         for resource in expected_resources:
-            if resource in available_resources:
-                result = await self.test_resource_reading(role, resource)
-                if "result" in result:
-                    content = result["result"]["contents"][0]["text"][:50] if result["result"]["contents"] else "No content"
+            if resource in resource_results:
+                ok, payload, error_msg = parse_rpc(resource_results[resource])
+                if ok:
+                    content = payload["contents"][0]["text"][:50] if payload["contents"] else "No content"
                     self.print_result(True, f"Can read {resource}", f"Content: {content}...")
-                elif "error" in result:
-                    error_msg = result['error'].get('message', str(result['error'])) if isinstance(result['error'], dict) else str(result['error'])
+                elif error_msg:
                     self.print_result(False, f"Cannot read {resource}", f"Error: {error_msg}")
             else:
                 self.print_result(False, f"Cannot see {resource}", "Not in available resources")
 
         # Test forbidden resources
-        all_resources = ["user://profile", "public://docs", "admin://system", "api://logs"]
-        forbidden_resources = [r for r in all_resources if r not in expected_resources]
+        forbidden_resources = FORBIDDEN[role]["resources"]
+        
+        leaked_resources = [r for r in forbidden_resources if r in available_resources]
+        results = await asyncio.gather(*(
+            self.test_resource_reading(role, resource) for resource in leaked_resources
+        ))
+        resource_results = dict(zip(leaked_resources, results))
         
         for resource in forbidden_resources:
-            if resource not in available_resources:
+            if resource not in resource_results:
                 self.print_result(True, f"Correctly blocked from {resource}", "Not visible in listings")
             else:
-                result = await self.test_resource_reading(role, resource)
-                if "error" in result:
-                    error_msg = result['error'].get('message', str(result['error'])) if isinstance(result['error'], dict) else str(result['error'])
+                _, _, error_msg = parse_rpc(resource_results[resource])
+                if error_msg:
                     self.print_result(True, f"Correctly blocked from reading {resource}", f"Error: {error_msg}")
                 else:
                     self.print_result(False, f"Unexpectedly allowed to read {resource}", "Should have been blocked")
 
         # Test Prompts
-        print(f"\n💬 Testing Prompts Access for {role}")
-        print("-" * 30)
+        self._output.append(f"\n💬 Testing Prompts Access for {role}")
+        self._output.append("-" * 30)
         
         available_prompts = await self.test_prompts_listing(role)
         expected_prompts = expected["prompts"]
         
-        print(f"   📋 Available prompts: {available_prompts}")
+        self._output.append(f"   📋 Available prompts: {available_prompts}")
         
         # Test expected prompts
+        visible_prompts = [p for p in expected_prompts if p in available_prompts]
+        results = await asyncio.gather(*(
+            self.test_prompt_usage(role, prompt, PROMPT_ARGS.get(prompt)) for prompt in visible_prompts
+        ))
+        prompt_results = dict(zip(visible_prompts, results))
+        
         for prompt in expected_prompts:
-            if prompt in available_prompts:
-                if prompt == "user_query":
-                    result = await self.test_prompt_usage(role, prompt, {"query": "test question"})
-                elif prompt == "admin_report":
-                    result = await self.test_prompt_usage(role, prompt, {"period": "Q1", "details": "summary"})
-                elif prompt == "sql_analysis":
-                    result = await self.test_prompt_usage(role, prompt, {"sql_query": "SELECT * FROM test"})
-                else:
-                    result = await self.test_prompt_usage(role, prompt)
-                
-                if "result" in result:
-                    content = result["result"]["messages"][0]["content"]["text"][:50] if result["result"]["messages"] else "No content"
+            if prompt in prompt_results:
+                ok, payload, error_msg = parse_rpc(prompt_results[prompt])
+                if ok:
+                    content = payload["messages"][0]["content"]["text"][:50] if payload["messages"] else "No content"
                     self.print_result(True, f"Can use {prompt}", f"Content: {content}...")
-                elif "error" in result:
-                    error_msg = result['error'].get('message', str(result['error'])) if isinstance(result['error'], dict) else str(result['error'])
+                elif error_msg:
                     self.print_result(False, f"Cannot use {prompt}", f"Error: {error_msg}")
             else:
                 self.print_result(False, f"Cannot see {prompt}", "Not in available prompts")
 
         # Test forbidden prompts
-        all_prompts = ["user_query", "admin_report", "sql_analysis"]
-        forbidden_prompts = [p for p in all_prompts if p not in expected_prompts]
+        forbidden_prompts = FORBIDDEN[role]["prompts"]
+        
+        leaked_prompts = [p for p in forbidden_prompts if p in available_prompts]
+        results = await asyncio.gather(*(
+            self.test_prompt_usage(role, prompt, {"query": "test"}) for prompt in leaked_prompts
+        ))
+        prompt_results = dict(zip(leaked_prompts, results))
         
         for prompt in forbidden_prompts:
-            if prompt not in available_prompts:
+            if prompt not in prompt_results:
                 self.print_result(True, f"Correctly blocked from {prompt}", "Not visible in listings")
             else:
-                result = await self.test_prompt_usage(role, prompt, {"query": "test"})
-                if "error" in result:
-                    error_msg = result['error'].get('message', str(result['error'])) if isinstance(result['error'], dict) else str(result['error'])
+                _, _, error_msg = parse_rpc(prompt_results[prompt])
+                if error_msg:
                     self.print_result(True, f"Correctly blocked from using {prompt}", f"Error: {error_msg}")
                 else:
                     self.print_result(False, f"Unexpectedly allowed to use {prompt}", "Should have been blocked")
 
+        self.flush_output()
+
     async def test_all_roles(self):
         """Test all roles comprehensively."""
         print("🔒 Comprehensive MCP Authorization Test")
@@ -319,14 +412,10 @@ class ComprehensiveTestClient:
             print(f"\n🧪 {description}")
             result = await self.test_tool_execution(role, tool, args)
             
-            if "result" in result:
-                print(f"   ✅ Success: {result['result']['content'][0]['text'][:60]}...")
-            elif "error" in result:
-                error = result['error']
-                if isinstance(error, dict):
-                    error_msg = error.get('message', str(error))
-                else:
-                    error_msg = str(error)
+            ok, payload, error_msg = parse_rpc(result)
+            if ok:
+                print(f"   ✅ Success: {payload['content'][0]['text'][:60]}...")
+            elif error_msg:
                 print(f"   ❌ Blocked: {error_msg}")
             else:
                 print(f"   ⚠️  Unexpected response: {result}")
@@ -343,30 +432,32 @@ async def main():
         print("Available roles: admin, analyst, user, public")
         return
     
-    client = ComprehensiveTestClient()
-    
-    # Check if server is running
-    try:
-        async with httpx.AsyncClient() as http_client:
-            response = await http_client.get(f"{client.server_url}/")
-            print(f"🌐 Connected to server at {client.server_url}")
-    except Exception as e:
-        print(f"❌ Cannot connect to server at {client.server_url}")
-        print(f"   Make sure the server is running: python comprehensive_server.py")
-        return
-    
-    command = sys.argv[1].lower()
-    
-    if command == "all":
-        await client.test_all_roles()
-    elif command == "demo":
-        await client.quick_demo()
-    elif command in client.api_keys:
-        await client.test_single_role(command)
-    else:
-        print(f"❌ Unknown command: {command}")
-        print("Available commands: all, demo, admin, analyst, user, public")
+    async with ComprehensiveTestClient() as client:
+        command = sys.argv[1].lower()
+        
+        # No separate liveness probe: the first real request proves connectivity
+        try:
+            if command == "all":
+                await client.test_all_roles()
+            elif command == "demo":
+                await client.quick_demo()
+            elif command in client.api_keys:
+                await client.test_single_role(command)
+            else:
+                print(f"❌ Unknown command: {command}")
+                print("Available commands: all, demo, admin, analyst, user, public")
+        except CONNECT_ERRORS as e:
+            print(f"❌ Cannot connect to server at {client.server_url}: {e}")
+            print(f"   Make sure the server is running: python comprehensive_server.py")
 
 
 if __name__ == "__main__":
+    # uvloop is optional and unavailable on Windows; use it when present
+    if sys.platform != "win32":
+        try:
+            import uvloop
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        except ImportError:
+            pass
+    
     asyncio.run(main())
@@ -9,17 +9,34 @@ This example shows how MCP Auth Guard can secure all three types of MCP capabili
 """
 
 import asyncio
+import sys
 from pathlib import Path
+from types import MappingProxyType
+from typing import Callable, List, Optional, Tuple
 from fastmcp import FastMCP
 from mcp_auth_guard import create_api_key_middleware
 
+# API key -> roles, fixed at startup and shared read-only
+API_KEY_ROLES = MappingProxyType({
+    "admin-key-123": ("admin",),
+    "analyst-key-456": ("analyst",),
+    "user-key-789": ("user",),
+    "public-key-000": ("public",),
+})
+
+# Resource URIs, interned so handler lookups hit the identity fast path
+USER_PROFILE_URI = sys.intern("user://profile")
+PUBLIC_DOCS_URI = sys.intern("public://docs")
+ADMIN_SYSTEM_URI = sys.intern("admin://system")
+API_LOGS_URI = sys.intern("api://logs")
+
 # Sample resource data
-RESOURCES_DATA = {
-    "user://profile": "User profile information - private data",
-    "public://docs": "Public documentation - anyone can read",
-    "admin://system": "System configuration - admin only",
-    "api://logs": "API logs - admin and analyst access"
-}
+RESOURCES_DATA = MappingProxyType({
+    USER_PROFILE_URI: "User profile information - private data",
+    PUBLIC_DOCS_URI: "Public documentation - anyone can read",
+    ADMIN_SYSTEM_URI: "System configuration - admin only",
+    API_LOGS_URI: "API logs - admin and analyst access"
+})
 
 # Sample prompt templates
 PROMPTS_DATA = {
@@ -40,71 +57,94 @@ PROMPTS_DATA = {
     }
 }
 
+# Bind each template's formatter once so prompt handlers call it directly,
+# then freeze the table (entries stay shared, read-only, across workers)
+for _prompt in PROMPTS_DATA.values():
+    _prompt["render"] = _prompt["template"].format
+PROMPTS_DATA = MappingProxyType({sys.intern(k): v for k, v in PROMPTS_DATA.items()})
+
+
+# (kind, name or URI, handler) for every capability, in registration order
+CAPABILITIES: List[Tuple[str, str, Callable]] = []
+
+
+def capability(kind: str, name: Optional[str] = None):
+    """Mark a handler for registration as a tool, resource, or prompt."""
+    def mark(fn: Callable) -> Callable:
+        CAPABILITIES.append((kind, name or fn.__name__, fn))
+        return fn
+    return mark
+
+
+# ========== TOOLS ==========
+
+@capability("tool")
+def get_user_info(user_id: str) -> str:
+    """Get user information (requires user+ access)."""
+    return f"User info for {user_id}: John Doe, Role: Developer"
+
+@capability("tool")
+def delete_user(user_id: str) -> str:
+    """Delete a user account (requires admin access)."""
+    return f"User {user_id} has been deleted"
+
+@capability("tool")
+def query_database(sql: str) -> str:
+    """Execute database query (requires analyst+ access)."""
+    return f"Query result: {sql} returned 42 rows"
+
+@capability("tool")
+def public_info() -> str:
+    """Get public information (no auth required)."""
+    return "This is public information available to everyone"
+
+# ========== RESOURCES ==========
+
+@capability("resource", USER_PROFILE_URI)
+async def user_profile_resource():
+    """User profile resource (private)."""
+    return RESOURCES_DATA[USER_PROFILE_URI]
+
+@capability("resource", PUBLIC_DOCS_URI)
+async def public_docs_resource():
+    """Public documentation resource."""
+    return RESOURCES_DATA[PUBLIC_DOCS_URI]
+
+@capability("resource", ADMIN_SYSTEM_URI)
+async def admin_system_resource():
+    """System configuration resource (admin only)."""
+    return RESOURCES_DATA[ADMIN_SYSTEM_URI]
+
+@capability("resource", API_LOGS_URI)
+async def api_logs_resource():
+    """API logs resource (admin/analyst)."""
+    return RESOURCES_DATA[API_LOGS_URI]
+
+# ========== PROMPTS ==========
+
+@capability("prompt", "user_query")
+async def user_query_prompt(query: str):
+    """General user query prompt."""
+    return PROMPTS_DATA["user_query"]["render"](query=query)
+
+@capability("prompt", "admin_report")
+async def admin_report_prompt(period: str, details: str):
+    """Administrative report prompt (admin only)."""
+    return PROMPTS_DATA["admin_report"]["render"](period=period, details=details)
+
+@capability("prompt", "sql_analysis")
+async def sql_analysis_prompt(sql_query: str):
+    """SQL analysis prompt (analyst+ access)."""
+    return PROMPTS_DATA["sql_analysis"]["render"](sql_query=sql_query)
+
 
 def create_comprehensive_server() -> FastMCP:
     """Create MCP server with tools, resources, and prompts."""
     mcp = FastMCP("Comprehensive Demo Server")
 
-    # ========== TOOLS ==========
-    
-    @mcp.tool()
-    def get_user_info(user_id: str) -> str:
-        """Get user information (requires user+ access)."""
-        return f"User info for {user_id}: John Doe, Role: Developer"
-
-    @mcp.tool()
-    def delete_user(user_id: str) -> str:
-        """Delete a user account (requires admin access)."""
-        return f"User {user_id} has been deleted"
-
-    @mcp.tool() 
-    def query_database(sql: str) -> str:
-        """Execute database query (requires analyst+ access)."""
-        return f"Query result: {sql} returned 42 rows"
-
-    @mcp.tool()
-    def public_info() -> str:
-        """Get public information (no auth required)."""
-        return "This is public information available to everyone"
-
-    # ========== RESOURCES ==========
-    
-    @mcp.resource("user://profile")
-    async def user_profile_resource():
-        """User profile resource (private)."""
-        return RESOURCES_DATA["user://profile"]
-
-    @mcp.resource("public://docs")
-    async def public_docs_resource():
-        """Public documentation resource."""
-        return RESOURCES_DATA["public://docs"]
-
-    @mcp.resource("admin://system")
-    async def admin_system_resource():
-        """System configuration resource (admin only)."""
-        return RESOURCES_DATA["admin://system"]
-
-    @mcp.resource("api://logs")
-    async def api_logs_resource():
-        """API logs resource (admin/analyst)."""
-        return RESOURCES_DATA["api://logs"]
-
-    # ========== PROMPTS ==========
-    
-    @mcp.prompt("user_query")
-    async def user_query_prompt(query: str):
-        """General user query prompt."""
-        return PROMPTS_DATA["user_query"]["template"].format(query=query)
-
-    @mcp.prompt("admin_report")
-    async def admin_report_prompt(period: str, details: str):
-        """Administrative report prompt (admin only)."""
-        return PROMPTS_DATA["admin_report"]["template"].format(period=period, details=details)
-
-    @mcp.prompt("sql_analysis")
-    async def sql_analysis_prompt(sql_query: str):
-        """SQL analysis prompt (analyst+ access)."""
-        return PROMPTS_DATA["sql_analysis"]["template"].format(sql_query=sql_query)
+    register = {"tool": mcp.tool, "resource": mcp.resource, "prompt": mcp.prompt}
+    for kind, name, fn in CAPABILITIES:
+        register[kind](name)(fn)
 
     return mcp
 
@@ -115,12 +155,7 @@ def create_auth_middleware():
     
     return create_api_key_middleware(
         policies=policy_file,
-        api_key_roles={
-            "admin-key-123": ["admin"],
-            "analyst-key-456": ["analyst"],
-            "user-key-789": ["user"],
-            "public-key-000": ["public"]
-        },
+        api_key_roles=API_KEY_ROLES,
         enable_audit_logging=True,
     )
 
@@ -6,9 +6,15 @@ Demonstrates different approaches to policy governance and management.
 """
 
 import asyncio
+import atexit
+import hashlib
+import hmac
 import json
 import logging
+import re
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from queue import SimpleQueue
 from typing import List, Optional
 from datetime import datetime
 
@@ -19,6 +25,11 @@ from mcp_auth_guard.policy.loader import PolicyLoader
 from mcp_auth_guard.policy.builder import policy, rule
 
 
+# Policies that guard administrative access and must never be removed:
+# anything mentioning "admin", plus "root"/"super" as whole name segments
+PROTECTED_POLICY_NAME = re.compile(r"(?i)admin|(?:^|[\W_])(?:root|super)(?:$|[\W_])")
+
+
 class PolicyManager:
     """Centralized policy management with governance controls."""
     
@@ -26,6 +37,12 @@ class PolicyManager:
         self.middleware = middleware
         self.audit_log = audit_log
         self.logger = self._setup_audit_logger()
+        self._protected = self._classify_protected(middleware.get_policy_names())
+    
+    @staticmethod
+    def _classify_protected(names: List[str]) -> frozenset:
+        """Names of the policies that are protected from removal."""
+        return frozenset(name for name in names if PROTECTED_POLICY_NAME.search(name))
     
     def _setup_audit_logger(self):
         """Set up audit logging for policy changes."""
@@ -35,7 +52,12 @@ class PolicyManager:
             '%(asctime)s - %(levelname)s - %(message)s'
         )
         handler.setFormatter(formatter)
-        logger.addHandler(handler)
+        # Callers only enqueue records; the listener thread does the file I/O
+        queue = SimpleQueue()
+        self._audit_listener = QueueListener(queue, handler)
+        self._audit_listener.start()
+        atexit.register(self._audit_listener.stop)
+        logger.addHandler(QueueHandler(queue))
         logger.setLevel(logging.INFO)
         return logger
     
@@ -58,17 +80,18 @@ class PolicyManager:
             
             # Add policy
             self.middleware.add_policy(policy)
+            self._protected |= self._classify_protected([policy.name])
             
             # Audit log
             self.logger.info(
-                f"POLICY_ADDED: {policy.name} by {admin_user} - {reason} "
-                f"- Rules: {len(policy.rules)}"
+                "POLICY_ADDED: %s by %s - %s - Rules: %d",
+                policy.name, admin_user, reason, len(policy.rules)
             )
             
             return True
             
         except Exception as e:
-            self.logger.error(f"POLICY_ADD_FAILED: {admin_user} - {e}")
+            self.logger.error("POLICY_ADD_FAILED: %s - %s", admin_user, e)
             raise
     
     def remove_policy(
@@ -79,8 +102,10 @@ class PolicyManager:
     ) -> bool:
         """Remove a policy with audit trail."""
         try:
-            # Safety check - don't remove if it would lock out admins
-            if "admin" in policy_name.lower():
+            # Safety check - don't remove if it would lock out admins. Policies
+            # added behind the manager's back are not in _protected, so
+            # unknown names are classified on the spot
+            if policy_name in self._protected or PROTECTED_POLICY_NAME.search(policy_name):
                 raise ValueError("Cannot remove admin policies for safety")
             
             # Remove policy
@@ -88,17 +113,17 @@ class PolicyManager:
             
             if success:
                 self.logger.info(
-                    f"POLICY_REMOVED: {policy_name} by {admin_user} - {reason}"
+                    "POLICY_REMOVED: %s by %s - %s", policy_name, admin_user, reason
                 )
             else:
                 self.logger.warning(
-                    f"POLICY_REMOVE_FAILED: {policy_name} not found - {admin_user}"
+                    "POLICY_REMOVE_FAILED: %s not found - %s", policy_name, admin_user
                 )
             
             return success
             
         except Exception as e:
-            self.logger.error(f"POLICY_REMOVE_ERROR: {admin_user} - {e}")
+            self.logger.error("POLICY_REMOVE_ERROR: %s - %s", admin_user, e)
             raise
     
     def update_policies_from_git(
@@ -118,15 +143,16 @@ class PolicyManager:
             
             # Reload all policies
             self.middleware.reload_policies(new_policies)
+            self._protected = self._classify_protected(self.middleware.get_policy_names())
             
             # Audit log
             self.logger.info(
-                f"POLICIES_SYNCED_FROM_GIT: {len(new_policies)} policies "
-                f"loaded from {git_path} by {admin_user}"
+                "POLICIES_SYNCED_FROM_GIT: %d policies loaded from %s by %s",
+                len(new_policies), git_path, admin_user
             )
             
         except Exception as e:
-            self.logger.error(f"GIT_SYNC_FAILED: {e}")
+            self.logger.error("GIT_SYNC_FAILED: %s", e)
             raise
 
 
@@ -136,12 +162,27 @@ class SecurePolicyAPI:
     def __init__(self, policy_manager: PolicyManager):
         self.policy_manager = policy_manager
         self.admin_api_keys = {"super-admin-key", "policy-admin-key"}
+        # Digest -> stable admin id; keys are only ever compared as digests
+        self._admin_digests = {
+            self._digest(key): f"admin_{i}"
+            for i, key in enumerate(sorted(self.admin_api_keys))
+        }
+    
+    @staticmethod
+    def _digest(api_key: str) -> bytes:
+        return hashlib.blake2b(api_key.encode(), digest_size=16).digest()
     
     def _authenticate_admin(self, api_key: str) -> str:
         """Authenticate admin user."""
-        if api_key not in self.admin_api_keys:
+        digest = self._digest(api_key)
+        admin_user = None
+        # Check every entry so timing does not depend on which key matched
+        for known, admin_id in self._admin_digests.items():
+            if hmac.compare_digest(digest, known):
+                admin_user = admin_id
+        if admin_user is None:
             raise PermissionError("Invalid admin API key")
-        return f"admin_{hash(api_key) % 1000}"
+        return admin_user
     
     async def add_policy_api(
         self,
@@ -7,10 +7,24 @@ when connecting via HTTP transport.
 """
 
 import asyncio
+from typing import List
+
 from fastmcp import Client
 
-async def test_role(role_name: str, api_key: str):
-    """Test a specific user role with HTTP transport."""
+async def call_tool(client: Client, tool_name: str, args: dict) -> str:
+    """Call one tool and describe the outcome."""
+    time_str = f" ({args['time']})" if args.get('time') != 'day' else ""
+    try:
+        result = await client.call_tool(tool_name, args)
+        return f"   ✅ {tool_name}{time_str}: {result.data[:60]}..."
+    except Exception as e:
+        return f"   ❌ {tool_name}{time_str}: {e}"
+
+async def test_role(role_name: str, api_key: str) -> List[str]:
+    """Test a specific user role with HTTP transport.
+
+    Returns the report lines so concurrent roles can be printed in order.
+    """
     config = {
         "mcpServers": {
             "weather_service": {
@@ -28,15 +42,14 @@ async def test_role(role_name: str, api_key: str):
     
     client = Client(config)
     
-    print(f"\n👤 Testing role: {role_name.upper()}")
-    print("-" * 40)
+    lines = [f"\n👤 Testing role: {role_name.upper()}", "-" * 40]
     
     try:
         async with client:
             # List available tools
             tools = await client.list_tools()
-            tool_names = [tool.name for tool in tools]
-            print(f"🛠️ Available tools: {tool_names}")
+            tool_names = frozenset(tool.name for tool in tools)
+            lines.append(f"🛠️ Available tools: {[tool.name for tool in tools]}")
             
             # Test calling tools
             test_tools = [
@@ -47,17 +60,17 @@ async def test_role(role_name: str, api_key: str):
                 ("get_saturn_weather", {"time": "day"}),
             ]
             
-            for tool_name, args in test_tools:
-                if tool_name in tool_names:
-                    time_str = f" ({args['time']})" if args.get('time') != 'day' else ""
-                    try:
-                        result = await client.call_tool(tool_name, args)
-                        print(f"   ✅ {tool_name}{time_str}: {result.data[:60]}...")
-                    except Exception as e:
-                        print(f"   ❌ {tool_name}{time_str}: {e}")
+            # Calls are independent; gather keeps them in test_tools order
+            lines.extend(await asyncio.gather(*(
+                call_tool(client, tool_name, args)
+                for tool_name, args in test_tools
+                if tool_name in tool_names
+            )))
                         
     except Exception as e:
-        print(f"❌ Connection failed for {role_name}: {e}")
+        lines.append(f"❌ Connection failed for {role_name}: {e}")
+    
+    return lines
 
 async def main():
     """Test all user roles via HTTP transport."""
@@ -73,9 +86,12 @@ async def main():
         ("intern", "demo-key-intern"),
     ]
     
-    for role_name, api_key in roles:
-        await test_role(role_name, api_key)
-        await asyncio.sleep(0.5)
+    # Roles run concurrently; reports are printed in the order above
+    reports = await asyncio.gather(
+        *(test_role(role_name, api_key) for role_name, api_key in roles)
+    )
+    for lines in reports:
+        print("\n".join(lines))
     
     print("\n" + "=" * 60)
     print("📋 Policy Summary:")
@@ -7,52 +7,212 @@ with different authentication levels and policies.
 """
 
 import asyncio
-import json
+import importlib.util
+import os
 import sys
+import time
+import warnings
+from contextlib import AsyncExitStack, asynccontextmanager
+from dataclasses import dataclass, field
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, Any, List
+from types import MappingProxyType
+from typing import TYPE_CHECKING, AsyncIterator, ClassVar, Dict, Any, List, Mapping, Optional, Tuple
 
 from fastmcp import Client
 from fastmcp.client.transports import StdioTransport, StreamableHttpTransport, SSETransport
 
+# Negotiate HTTP/2 when the optional h2 package is installed, so concurrent
+# requests in a session share one connection instead of opening one each
+HTTP2_ENABLED = importlib.util.find_spec("h2") is not None
 
+# Newer fastmcp releases build their HTTP clients with httpx2, which older
+# releases do not install; without it the transports use their own clients
+HTTPX2_AVAILABLE = importlib.util.find_spec("httpx2") is not None
+
+if TYPE_CHECKING:
+    import httpx2
+
+# Keep idle connections around for the whole demo run
+HTTP_LIMITS = MappingProxyType({"max_keepalive_connections": 16, "keepalive_expiry": 300})
+
+
+def pooled_http_client(
+    headers: Optional[Dict[str, str]] = None,
+    timeout: Optional["httpx2.Timeout"] = None,
+    auth: Optional["httpx2.Auth"] = None,
+    **kwargs,
+) -> "httpx2.AsyncClient":
+    """HTTP client factory for the HTTP/SSE transports (one client per session)."""
+    import httpx2
+
+    return httpx2.AsyncClient(
+        headers=headers,
+        timeout=timeout or httpx2.Timeout(30.0, read=300.0),
+        auth=auth,
+        http2=HTTP2_ENABLED,
+        limits=httpx2.Limits(**HTTP_LIMITS),
+        **kwargs,
+    )
+
+
+# Factory handed to the HTTP/SSE transports; None keeps their default client
+HTTP_CLIENT_FACTORY = pooled_http_client if HTTPX2_AVAILABLE else None
+
+
+_tool_name = attrgetter("name")
+
+# Alternative transport names accepted by WeatherMCPTestClient
+TRANSPORT_ALIASES = MappingProxyType({"streamable": "http"})
+
+# Demo API key for each role, in test order
+ROLE_API_KEYS = MappingProxyType({
+    "admin": "demo-key-admin",
+    "user": "demo-key-user",
+    "intern": "demo-key-intern",
+})
+ROLES = tuple(ROLE_API_KEYS)
+
+# (tool, arguments) exercised for every role
+TEST_CASES: Tuple[Tuple[str, Mapping[str, Any]], ...] = tuple(
+    (tool_name, MappingProxyType(args))
+    for tool_name, args in (
+        ("get_mars_weather", {"time": "day"}),
+        ("get_venus_weather", {"time": "night"}),
+        ("get_jupiter_weather", {"time": "day"}),
+        ("get_jupiter_weather", {"time": "night"}),
+        ("get_saturn_weather", {"time": "day"}),
+    )
+)
+
+# Weather server launched by the STDIO transport
+SERVER_SCRIPT = Path(__file__).parent / "weather_server.py"
+
+# Each STDIO session spawns a Python interpreter that imports FastMCP; cap how
+# many start at once so concurrent roles don't thrash small machines
+_SPAWN_SEM = asyncio.Semaphore(min(os.cpu_count() or 1, 4))
+
+# (transport, url) -> (consecutive connect failures, last failure at). Once a
+# server has failed BREAKER_THRESHOLD times, later sessions fail immediately
+# until BREAKER_COOLDOWN seconds have passed since the last failure.
+_BREAKER: Dict[Tuple[str, Optional[str]], Tuple[int, float]] = {}
+BREAKER_THRESHOLD = 2
+BREAKER_COOLDOWN = 10 * 60  # seconds
+
+# Roles connect concurrently, so until a target has accepted one session its
+# connection attempts take turns; otherwise every role would pass the breaker
+# check before the first failure is recorded
+_CONNECT_LOCKS: Dict[Tuple[str, Optional[str]], asyncio.Lock] = {}
+_CONNECTED: set = set()
+
+
+@asynccontextmanager
+async def _connect_turn(target: Tuple[str, Optional[str]]) -> AsyncIterator[None]:
+    """Serialize connection attempts to a target that has not connected yet."""
+    if target in _CONNECTED:
+        yield
+        return
+    async with _CONNECT_LOCKS.setdefault(target, asyncio.Lock()):
+        yield
+
+
+@dataclass(slots=True)
 class WeatherMCPTestClient:
-    """Real MCP test client using FastMCP Client with configurable transport."""
+    """Real MCP test client using FastMCP Client with configurable transport.
     
-    def __init__(self, api_key: str, role: str, transport_type: str = "stdio", server_url: str = None):
-        """Initialize test client with API key and role.
+    Attributes:
+        api_key: API key for authentication
+        role: User role (admin, user, intern)
+        transport_type: Transport type ("stdio", "http" or its alias
+            "streamable", or the deprecated "sse")
+        server_url: URL for HTTP/SSE transports (e.g., "https://api.example.com/mcp")
+        output: Collect report lines here instead of printing them
+    """
+    
+    api_key: str
+    role: str
+    transport_type: str = "stdio"
+    server_url: Optional[str] = None
+    output: Optional[List[str]] = field(default=None, repr=False)
+    # Environment variables for STDIO transport, headers for HTTP/SSE
+    server_env: Dict[str, str] = field(init=False, repr=False)
+    http_headers: Dict[str, str] = field(init=False, repr=False)
+    _client: Optional[Client] = field(init=False, default=None, repr=False)
+    
+    server_script: ClassVar[Path] = SERVER_SCRIPT
+    
+    # Identity variables for STDIO (FastMCP turns MCP_X_* into headers) and
+    # the matching HTTP headers, both in (api key, role, user, agent) order
+    _ENV_KEYS: ClassVar[Tuple[str, ...]] = (
+        "MCP_X_API_KEY", "MCP_X_USER_ROLES", "MCP_X_USER_ID", "MCP_X_AGENT_ID",
+    )
+    _HEADER_KEYS: ClassVar[Tuple[str, ...]] = (
+        "X-API-Key", "X-User-Roles", "X-User-ID", "X-Agent-ID",
+    )
+    
+    def __post_init__(self):
+        transport_type = self.transport_type.lower()
+        self.transport_type = TRANSPORT_ALIASES.get(transport_type, transport_type)
         
-        Args:
-            api_key: API key for authentication
-            role: User role (admin, user, intern)
-            transport_type: Transport type ("stdio", "http", "sse")
-            server_url: URL for HTTP/SSE transports (e.g., "https://api.example.com/mcp")
+        role = self.role
+        identity = (self.api_key, role, f"test_user_{role}", f"test_agent_{role}")
+        self.server_env = dict(zip(self._ENV_KEYS, identity))
+        self.http_headers = dict(zip(self._HEADER_KEYS, identity))
+        self.http_headers["Content-Type"] = "application/json"
+    
+    def emit(self, *lines: str):
+        """Write report lines in one call, or buffer them when collecting output."""
+        if self.output is None:
+            sys.stdout.write("\n".join(lines) + "\n")
+        else:
+            self.output.extend(lines)
+    
+    async def get_client(self) -> Client:
+        """Get the FastMCP client for this role, creating it on first use.
+        
+        The same client (and MCP session, once entered) is reused for every
+        call made by this role.
         """
-        self.api_key = api_key
-        self.role = role
-        self.transport_type = transport_type.lower()
-        self.server_url = server_url
-        self.server_script = Path(__file__).parent / "weather_server.py"
+        if self._client is None:
+            self._client = self._create_client()
+        return self._client
+    
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[Client]:
+        """Open an MCP session on this role's client.
         
-        # Set up environment variables for STDIO transport
-        # These environment variables are converted to headers by FastMCP
-        self.server_env = {
-            "MCP_X_API_KEY": api_key,
-            "MCP_X_USER_ROLES": role,
-            "MCP_X_USER_ID": f"test_user_{role}",
-            "MCP_X_AGENT_ID": f"test_agent_{role}",
-        }
+        STDIO servers are started under ``_SPAWN_SEM``; the slot is released
+        once the session is initialized, not held for the whole session.
         
-        # Set up HTTP headers for HTTP/SSE transports
-        self.http_headers = {
-            "X-API-Key": api_key,
-            "X-User-Roles": role,
-            "X-User-ID": f"test_user_{role}",
-            "X-Agent-ID": f"test_agent_{role}",
-            "Content-Type": "application/json"
-        }
+        Raises:
+            ConnectionError: If the server has recently failed to connect
+                ``BREAKER_THRESHOLD`` times
+        """
+        target = (self.transport_type, self.server_url)
+        async with AsyncExitStack() as stack:
+            async with _connect_turn(target):
+                failures, failed_at = _BREAKER.get(target, (0, 0.0))
+                if failures >= BREAKER_THRESHOLD and time.monotonic() - failed_at < BREAKER_COOLDOWN:
+                    raise ConnectionError(
+                        f"{self.transport_type} server unreachable "
+                        f"({failures} failed connection attempts), skipping"
+                    )
+                
+                client = await self.get_client()
+                try:
+                    if self.transport_type == "stdio":
+                        async with _SPAWN_SEM:
+                            await stack.enter_async_context(client)
+                    else:
+                        await stack.enter_async_context(client)
+                except Exception:
+                    _BREAKER[target] = (failures + 1, time.monotonic())
+                    raise
+                _BREAKER.pop(target, None)
+                _CONNECTED.add(target)
+            yield client
     
-    async def create_client(self) -> Client:
+    def _create_client(self) -> Client:
         """Create a FastMCP client connected to the weather server."""
         if self.transport_type == "stdio":
             # STDIO transport: pass auth via environment variables
@@ -69,129 +229,149 @@ class WeatherMCPTestClient:
                 raise ValueError("server_url is required for HTTP transport")
             transport = StreamableHttpTransport(
                 url=self.server_url,
-                headers=self.http_headers
+                headers=self.http_headers,
+                httpx_client_factory=HTTP_CLIENT_FACTORY,
             )
             return Client(transport)
             
         elif self.transport_type == "sse":
             # SSE transport: pass auth via HTTP headers
+            warnings.warn(
+                "SSE transport is deprecated since MCP 2025-03-26; use 'http' "
+                "(Streamable HTTP) instead",
+                DeprecationWarning,
+                stacklevel=2,
+            )
             if not self.server_url:
                 raise ValueError("server_url is required for SSE transport")
             transport = SSETransport(
                 url=self.server_url,
-                headers=self.http_headers
+                headers=self.http_headers,
+                httpx_client_factory=HTTP_CLIENT_FACTORY,
             )
             return Client(transport)
             
         else:
             raise ValueError(f"Unsupported transport type: {self.transport_type}. Use 'stdio', 'http', or 'sse'")
     
-    async def test_list_tools(self, client: Client) -> List[Dict[str, Any]]:
-        """Test listing available tools."""
-        print(f"\n🔍 [{self.role.upper()}] Testing tool listing...")
-        print(f"   Transport: {self.transport_type}")
-        print(f"   Using API key: {self.api_key}")
-        print(f"   User role: {self.role}")
+    async def test_list_tools(self, client: Client) -> Optional[List[str]]:
+        """Test listing available tools.
+        
+        Returns:
+            Visible tool names, or None if the listing failed
+        """
+        lines = [
+            f"\n🔍 [{self.role.upper()}] Testing tool listing...",
+            f"   Transport: {self.transport_type}",
+            f"   Using API key: {self.api_key}",
+            f"   User role: {self.role}",
+        ]
         if self.server_url:
-            print(f"   Server URL: {self.server_url}")
+            lines.append(f"   Server URL: {self.server_url}")
         
         try:
             tools_response = await client.list_tools()
             # Handle both list and ListToolsResult formats
-            if hasattr(tools_response, 'tools'):
-                tools = [tool.name for tool in tools_response.tools]
-            else:
-                tools = [tool.name for tool in tools_response]
-            print(f"   ✅ Visible tools: {tools}")
+            tools = list(map(_tool_name, getattr(tools_response, 'tools', tools_response)))
+            self.emit(*lines, f"   ✅ Visible tools: {tools}")
             return tools
         except Exception as e:
-            print(f"   ❌ Error listing tools: {e}")
-            return []
+            self.emit(*lines, f"   ❌ Error listing tools: {e}")
+            return None
     
     async def test_call_tool(self, client: Client, tool_name: str, **kwargs) -> Dict[str, Any]:
         """Test calling a specific tool."""
-        print(f"\n🛠️  [{self.role.upper()}] Testing tool call: {tool_name}")
-        print(f"   Arguments: {kwargs}")
+        result, lines = await self.call_tool_report(client, tool_name, kwargs)
+        self.emit(*lines)
+        return result
+    
+    async def call_tool_report(
+        self, client: Client, tool_name: str, arguments: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], List[str]]:
+        """Call a tool and return its result with report lines, without emitting.
+        
+        Concurrent calls use this so each call's lines stay together.
+        """
+        lines = [
+            f"\n🛠️  [{self.role.upper()}] Testing tool call: {tool_name}",
+            f"   Arguments: {arguments}",
+        ]
         
         try:
-            result = await client.call_tool(tool_name, kwargs)
-            print(f"   ✅ Success: {result.data}")
+            result = await client.call_tool(tool_name, arguments)
+            lines.append(f"   ✅ Success: {result.data}")
             return {
                 "success": True,
                 "result": result.data,
                 "message": f"Tool {tool_name} executed successfully"
-            }
+            }, lines
         except Exception as e:
-            print(f"   ❌ Error: {e}")
+            lines.append(f"   ❌ Error: {e}")
             return {
                 "success": False,
                 "error": str(e),
                 "message": f"Tool {tool_name} failed"
-            }
+            }, lines
     
     async def test_server_ping(self, client: Client) -> bool:
         """Test server connectivity."""
-        print(f"\n📡 [{self.role.upper()}] Testing server connectivity...")
+        header = f"\n📡 [{self.role.upper()}] Testing server connectivity..."
         
         try:
             await client.ping()
-            print(f"   ✅ Server is reachable")
+            self.emit(header, f"   ✅ Server is reachable")
             return True
         except Exception as e:
-            print(f"   ❌ Server ping failed: {e}")
+            self.emit(header, f"   ❌ Server ping failed: {e}")
             return False
 
 
+async def _run_for_role(
+    api_key: str, role: str, transport_type: str, server_url: Optional[str]
+) -> List[str]:
+    """Run every test case for one role and return its report lines."""
+    lines = [f"\n👤 Testing as: {role.upper()}", "-" * 40]
+    test_client = WeatherMCPTestClient(api_key, role, transport_type, server_url, output=lines)
+    
+    try:
+        async with test_client.session() as client:
+            # Test tool listing; a failed listing doubles as the reachability check
+            tools = await test_client.test_list_tools(client)
+            if tools is None:
+                lines.append(f"   ⚠️  Skipping tests for {role} - server unreachable")
+                return lines
+            available_tools = frozenset(tools)
+            
+            async def run_case(tool_name: str, args: Mapping[str, Any]) -> List[str]:
+                # Only test tools that are available to this role
+                if tool_name not in available_tools:
+                    return [f"\n🛠️  [{role.upper()}] Skipping {tool_name} - not in available tools"]
+                return (await test_client.call_tool_report(client, tool_name, dict(args)))[1]
+            
+            # Calls share the session concurrently; reports keep TEST_CASES order
+            for case_lines in await asyncio.gather(*[
+                run_case(tool_name, args) for tool_name, args in TEST_CASES
+            ]):
+                lines.extend(case_lines)
+    
+    except Exception as e:
+        lines.append(f"   ❌ Failed to create client for {role}: {e}")
+    
+    return lines
+
+
 async def run_comprehensive_tests(transport_type: str = "stdio", server_url: str = None):
     """Run comprehensive tests for different user roles using real MCP client."""
     print(f"🚀 Real MCP Auth Guard Demo - Weather Service Testing ({transport_type.upper()})")
     print("=" * 60)
     
-    # Test clients for different roles
-    test_users = [
-        ("demo-key-admin", "admin"),
-        ("demo-key-user", "user"),
-        ("demo-key-intern", "intern"),
-    ]
-    
-    for api_key, role in test_users:
-        print(f"\n👤 Testing as: {role.upper()}")
-        print("-" * 40)
-        
-        test_client = WeatherMCPTestClient(api_key, role, transport_type, server_url)
-        
-        try:
-            client = await test_client.create_client()
-            
-            async with client:
-                # Test server connectivity
-                if not await test_client.test_server_ping(client):
-                    print(f"   ⚠️  Skipping tests for {role} - server unreachable")
-                    continue
-                
-                # Test tool listing
-                available_tools = await test_client.test_list_tools(client)
-                
-                # Test various tool calls
-                test_cases = [
-                    ("get_mars_weather", {"time": "day"}),
-                    ("get_venus_weather", {"time": "night"}),
-                    ("get_jupiter_weather", {"time": "day"}),
-                    ("get_jupiter_weather", {"time": "night"}),
-                    ("get_saturn_weather", {"time": "day"}),
-                ]
-                
-                for tool_name, args in test_cases:
-                    # Only test tools that are available to this role
-                    if tool_name in available_tools:
-                        await test_client.test_call_tool(client, tool_name, **args)
-                    else:
-                        print(f"\n🛠️  [{role.upper()}] Skipping {tool_name} - not in available tools")
-                    
-                    await asyncio.sleep(0.1)  # Small delay for readability
-        
-        except Exception as e:
-            print(f"   ❌ Failed to create client for {role}: {e}")
+    # Roles run concurrently; each report is printed in ROLE_API_KEYS order
+    reports = await asyncio.gather(*[
+        _run_for_role(api_key, role, transport_type, server_url)
+        for role, api_key in ROLE_API_KEYS.items()
+    ])
+    for lines in reports:
+        sys.stdout.write("\n".join(lines) + "\n")
     
     print("\n" + "=" * 60)
     print("🎯 Key Policy Demonstrations:")
@@ -204,26 +384,18 @@ async def run_comprehensive_tests(transport_type: str = "stdio", server_url: str
 
 async def test_single_role(role: str = "admin", transport_type: str = "stdio", server_url: str = None):
     """Test a single role for debugging purposes."""
-    api_keys = {
-        "admin": "demo-key-admin",
-        "user": "demo-key-user", 
-        "intern": "demo-key-intern"
-    }
-    
-    if role not in api_keys:
-        print(f"Unknown role: {role}. Available: {list(api_keys.keys())}")
+    api_key = ROLE_API_KEYS.get(role)
+    if api_key is None:
+        print(f"Unknown role: {role}. Available: {ROLES}")
         return
     
-    api_key = api_keys[role]
     test_client = WeatherMCPTestClient(api_key, role, transport_type, server_url)
     
     print(f"🧪 Testing single role: {role.upper()}")
     print("-" * 30)
     
     try:
-        client = await test_client.create_client()
-        
-        async with client:
+        async with test_client.session() as client:
             # Test connectivity
             await test_client.test_server_ping(client)
             
@@ -238,23 +410,27 @@ async def test_single_role(role: str = "admin", transport_type: str = "stdio", s
         print(f"❌ Error testing {role}: {e}")
 
 
-async def test_http_example():
-    """Example test using HTTP transport."""
-    print("📡 Testing HTTP Transport Example")
-    print("-" * 40)
+async def test_transport_example(transport_type: str, server_url: str, role: str = "admin"):
+    """Show the client configuration for an HTTP or SSE transport.
     
-    # Example usage with HTTP transport
-    # Note: You would need a running HTTP server for this to work
-    server_url = "https://api.example.com/mcp"  # Replace with actual server URL
+    Args:
+        transport_type: Transport type ("http", "streamable", "sse")
+        server_url: Server endpoint URL
+        role: Role whose demo API key is configured
+    """
+    label = TRANSPORT_ALIASES.get(transport_type, transport_type).upper()
+    print(f"📡 Testing {label} Transport Example")
+    print("-" * 40)
     
+    # Note: You would need a running server at server_url for calls to work
     test_client = WeatherMCPTestClient(
-        api_key="demo-key-admin",
-        role="admin", 
-        transport_type="http",
+        api_key=ROLE_API_KEYS[role],
+        role=role,
+        transport_type=transport_type,
         server_url=server_url
     )
     
-    print(f"📋 HTTP Transport Configuration:")
+    print(f"📋 {label} Transport Configuration:")
     print(f"   • URL: {server_url}")
     print(f"   • Headers: {test_client.http_headers}")
     print(f"   • Authentication: X-API-Key header")
@@ -263,70 +439,45 @@ async def test_http_example():
     # It's here to show the configuration pattern
 
 
-async def test_sse_example():
-    """Example test using SSE transport."""
-    print("📡 Testing SSE Transport Example")
-    print("-" * 40)
-    
-    # Example usage with SSE transport
-    # Note: You would need a running SSE server for this to work
-    server_url = "https://api.example.com/sse"  # Replace with actual server URL
-    
-    test_client = WeatherMCPTestClient(
-        api_key="demo-key-user",
-        role="user",
-        transport_type="sse", 
-        server_url=server_url
+TRANSPORTS = ("http", "streamable", "sse")
+
+# Placeholder endpoints shown by the transport examples (replace with real URLs)
+EXAMPLE_URLS = {
+    "http": "https://api.example.com/mcp",
+    "streamable": "https://api.example.com/mcp",
+    "sse": "https://api.example.com/sse",
+}
+
+USAGE = """Usage:
+  python test_client.py                           # Test all roles with STDIO
+  python test_client.py [admin|user|intern]       # Test single role with STDIO
+  python test_client.py [http|sse] <server_url>   # Test all roles with HTTP/SSE
+  python test_client.py [role] [http|sse] <url>   # Test single role with HTTP/SSE
+
+  'streamable' is accepted as an alias for 'http'; SSE is deprecated."""
+
+# Command line shape -> coroutine factory taking the positional arguments
+COMMANDS = {
+    (): run_comprehensive_tests,
+    ("role",): test_single_role,
+    ("transport",): lambda transport: test_transport_example(transport, EXAMPLE_URLS[transport]),
+    ("transport", "url"): run_comprehensive_tests,
+    ("role", "transport", "url"): test_single_role,
+}
+
+
+def main(argv: List[str]):
+    """Run the command matching the shape of the positional arguments."""
+    shape = tuple(
+        "role" if arg in ROLES else "transport" if arg in TRANSPORTS else "url"
+        for arg in argv
     )
-    
-    print(f"📋 SSE Transport Configuration:")
-    print(f"   • URL: {server_url}")
-    print(f"   • Headers: {test_client.http_headers}")
-    print(f"   • Authentication: X-API-Key header")
+    command = COMMANDS.get(shape)
+    if command is None:
+        print(USAGE)
+        return
+    asyncio.run(command(*argv))
 
 
 if __name__ == "__main__":
-    if len(sys.argv) == 1:
-        # Run comprehensive tests with STDIO
-        asyncio.run(run_comprehensive_tests())
-    elif len(sys.argv) == 2:
-        arg = sys.argv[1]
-        if arg in ["admin", "user", "intern"]:
-            # Test single role with STDIO
-            asyncio.run(test_single_role(arg))
-        elif arg == "http":
-            # Show HTTP transport example
-            asyncio.run(test_http_example())
-        elif arg == "sse":
-            # Show SSE transport example
-            asyncio.run(test_sse_example())
-        else:
-            print("Usage: python test_client.py [admin|user|intern|http|sse] [server_url]")
-    elif len(sys.argv) == 3:
-        role_or_transport = sys.argv[1]
-        url_or_transport = sys.argv[2]
-        
-        if role_or_transport in ["admin", "user", "intern"] and url_or_transport in ["http", "sse"]:
-            print(f"Usage: python test_client.py {role_or_transport} {url_or_transport} <server_url>")
-        elif role_or_transport in ["http", "sse"]:
-            # Test with HTTP/SSE transport
-            server_url = url_or_transport
-            asyncio.run(run_comprehensive_tests(role_or_transport, server_url))
-        else:
-            print("Usage: python test_client.py [admin|user|intern] [http|sse] <server_url>")
-    elif len(sys.argv) == 4:
-        role = sys.argv[1]
-        transport_type = sys.argv[2] 
-        server_url = sys.argv[3]
-        
-        if role in ["admin", "user", "intern"] and transport_type in ["http", "sse"]:
-            # Test specific role with HTTP/SSE transport
-            asyncio.run(test_single_role(role, transport_type, server_url))
-        else:
-            print("Usage: python test_client.py [admin|user|intern] [http|sse] <server_url>")
-    else:
-        print("Usage:")
-        print("  python test_client.py                           # Test all roles with STDIO")
-        print("  python test_client.py [admin|user|intern]       # Test single role with STDIO")
-        print("  python test_client.py [http|sse] <server_url>   # Test all roles with HTTP/SSE")
-        print("  python test_client.py [role] [http|sse] <url>   # Test single role with HTTP/SSE")
+    main(sys.argv[1:])
@@ -7,12 +7,14 @@ an MCP server with intuitive YAML policies and multiple authentication methods.
 """
 
 import asyncio
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from fastmcp import FastMCP
 
-from mcp_auth_guard import AuthGuardMiddleware
-from mcp_auth_guard.middleware.utils import create_api_key_middleware
+if TYPE_CHECKING:
+    from mcp_auth_guard import AuthGuardMiddleware
 
 # Weather data for different planets
 WEATHER_DATA = {
@@ -34,52 +36,53 @@ WEATHER_DATA = {
     },
 }
 
+# Flattened (planet, time) -> forecast lookup, with each planet's daytime
+# forecast as the fallback for unknown times
+FORECASTS = {
+    (planet, time): forecast
+    for planet, forecasts in WEATHER_DATA.items()
+    for time, forecast in forecasts.items()
+}
+DEFAULT_FORECASTS = {planet: forecasts["day"] for planet, forecasts in WEATHER_DATA.items()}
 
-def create_weather_server() -> FastMCP:
-    """Create a FastMCP server with weather tools."""
-    mcp = FastMCP("Planetary Weather Service")
 
-    @mcp.tool()
-    def get_mars_weather(time: str = "day") -> str:
-        """Get current weather conditions on Mars.
+def _make_weather_tool(planet: str):
+    """Build the weather tool function for one planet."""
+    default = DEFAULT_FORECASTS[planet]
 
-        Args:
-            time: Time of day ("day" or "night")
-        """
-        return WEATHER_DATA["mars"].get(time, WEATHER_DATA["mars"]["day"])
+    def get_weather(time: str = "day") -> str:
+        return FORECASTS.get((planet, time)) or default
 
-    @mcp.tool()
-    def get_jupiter_weather(time: str = "day") -> str:
-        """Get current weather conditions on Jupiter.
+    get_weather.__name__ = f"get_{planet}_weather"
+    get_weather.__doc__ = f"""Get current weather conditions on {planet.title()}.
 
         Args:
             time: Time of day ("day" or "night")
         """
-        return WEATHER_DATA["jupiter"].get(time, WEATHER_DATA["jupiter"]["day"])
+    return get_weather
 
-    @mcp.tool()
-    def get_saturn_weather(time: str = "day") -> str:
-        """Get current weather conditions on Saturn.
-
-        Args:
-            time: Time of day ("day" or "night")
-        """
-        return WEATHER_DATA["saturn"].get(time, WEATHER_DATA["saturn"]["day"])
 
-    @mcp.tool()
-    def get_venus_weather(time: str = "day") -> str:
-        """Get current weather conditions on Venus.
+def create_weather_server() -> FastMCP:
+    """Create a FastMCP server with weather tools."""
+    mcp = FastMCP("Planetary Weather Service")
 
-        Args:
-            time: Time of day ("day" or "night")
-        """
-        return WEATHER_DATA["venus"].get(time, WEATHER_DATA["venus"]["day"])
+    # One get_<planet>_weather tool per planet, in WEATHER_DATA order
+    for planet in WEATHER_DATA:
+        mcp.tool(_make_weather_tool(planet))
 
     return mcp
 
 
-def create_auth_middleware() -> AuthGuardMiddleware:
-    """Create the Auth Guard middleware with policies."""
+@lru_cache(maxsize=1)
+def create_auth_middleware() -> "AuthGuardMiddleware":
+    """Create the Auth Guard middleware with policies.
+
+    Built once per process, so the policy file is parsed and indexed once
+    and every server created here shares the same middleware.
+    """
+    # Imported here so the tools can be built without loading Auth Guard
+    from mcp_auth_guard.middleware.utils import create_api_key_middleware
+    
     # Load policies from YAML file
     policy_file = Path(__file__).parent / "weather_policies.yaml"
 
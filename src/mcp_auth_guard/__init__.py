@@ -3,22 +3,29 @@ MCP Auth Guard: Intuitive authorization middleware for MCP tools.
 
 A modern, type-safe authorization system designed specifically for Model Context 
 Protocol (MCP) servers with seamless FastMCP integration.
+
+Public names are imported lazily on first access, so importing the package
+(e.g. for the CLI) does not load the middleware or FastMCP until needed.
 """
 
-from .middleware import AuthGuardMiddleware
-from .middleware.utils import (
-    create_api_key_middleware,
-    create_jwt_middleware, 
-    create_header_middleware,
-    create_no_auth_middleware
-)
-from .policy import PolicyEngine, PolicyBuilder
-from .identity import IdentityManager
-from .schemas import PolicyConfig, AuthConfig, ToolResource
-from .schemas.auth import AuthMethod
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .middleware import AuthGuardMiddleware
+    from .middleware.utils import (
+        create_api_key_middleware,
+        create_jwt_middleware,
+        create_header_middleware,
+        create_no_auth_middleware
+    )
+    from .policy import PolicyEngine, PolicyBuilder
+    from .identity import IdentityManager
+    from .schemas import PolicyConfig, AuthConfig, ToolResource
+    from .schemas.auth import AuthMethod
 
 __version__ = "1.0.0"
-__all__ = [
+__all__ = (
     "AuthGuardMiddleware",
     "create_api_key_middleware",
     "create_jwt_middleware",
@@ -31,4 +38,39 @@ __all__ = [
     "PolicyConfig",
     "AuthConfig", 
     "ToolResource",
-]
+)
+
+# Public name -> submodule that defines it
+_LAZY = {
+    "AuthGuardMiddleware": ".middleware",
+    "create_api_key_middleware": ".middleware.utils",
+    "create_jwt_middleware": ".middleware.utils",
+    "create_header_middleware": ".middleware.utils",
+    "create_no_auth_middleware": ".middleware.utils",
+    "PolicyEngine": ".policy",
+    "PolicyBuilder": ".policy",
+    "IdentityManager": ".identity",
+    "AuthMethod": ".schemas.auth",
+    "PolicyConfig": ".schemas",
+    "AuthConfig": ".schemas",
+    "ToolResource": ".schemas",
+}
+
+# Subpackages that were reachable as attributes when imports were eager
+_SUBPACKAGES = frozenset({"identity", "middleware", "policy", "schemas", "utils"})
+
+
+def __getattr__(name: str):
+    if name in _SUBPACKAGES:
+        return import_module(f".{name}", __name__)
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    # Cache on the module so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
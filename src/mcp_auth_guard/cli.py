@@ -1,23 +1,24 @@
 #!/usr/bin/env python3
-"""Command line interface for MCP Auth Guard."""
+"""Command line interface for MCP Auth Guard.
 
-import json
+Heavy dependencies (rich, yaml, the policy modules) are imported inside the
+commands that use them so that startup stays fast for light commands.
+"""
+
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 import typer
-import yaml
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.syntax import Syntax
-
-from .policy.loader import PolicyLoader
-from .policy.builder import policy, rule
-from .schemas.policy import Effect, ConditionOperator
 
 app = typer.Typer(help="MCP Auth Guard - Authorization middleware for MCP tools")
-console = Console()
+
+
+@lru_cache(maxsize=1)
+def _console():
+    """Get the shared rich console, creating it on first use."""
+    from rich.console import Console
+    return Console()
 
 
 @app.command()
@@ -26,6 +27,10 @@ def validate(
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose output")
 ):
     """Validate a policy file."""
+    from rich.panel import Panel
+    from .policy.loader import PolicyLoader
+    
+    console = _console()
     try:
         policy_config = PolicyLoader.load_from_file(policy_file)
         
@@ -51,6 +56,11 @@ def info(
     policy_file: Path = typer.Argument(..., help="Path to policy YAML file")
 ):
     """Show detailed information about a policy."""
+    from rich.panel import Panel
+    from rich.table import Table
+    from .policy.loader import PolicyLoader
+    
+    console = _console()
     try:
         policy_config = PolicyLoader.load_from_file(policy_file)
         
@@ -95,6 +105,10 @@ def create(
     description: Optional[str] = typer.Option(None, "--description", "-d", help="Policy description")
 ):
     """Create a new policy template."""
+    from .policy.builder import policy, rule
+    from .policy.loader import PolicyLoader
+    
+    console = _console()
     
     # Create a sample policy
     sample_policy = (policy(name)
@@ -140,6 +154,10 @@ def test(
     action: str = typer.Option("call", "--action", "-a", help="Action to test")
 ):
     """Test a policy against specific parameters."""
+    from rich.panel import Panel
+    from .policy.loader import PolicyLoader
+    
+    console = _console()
     try:
         from .policy.engine import PolicyEngine
         from .schemas.auth import AuthContext, AuthMethod
@@ -194,6 +212,9 @@ def format(
     output: Optional[Path] = typer.Option(None, "--output", "-o", help="Output file (overwrites input if not specified)")
 ):
     """Format and clean up a policy file."""
+    from .policy.loader import PolicyLoader
+    
+    console = _console()
     try:
         # Load and re-save to format
         policy_config = PolicyLoader.load_from_file(policy_file)
@@ -214,11 +235,16 @@ def convert(
     format: str = typer.Option("yaml", "--format", "-f", help="Output format (yaml/json)")
 ):
     """Convert between policy file formats."""
+    import json
+    import yaml
+    from .policy.loader import PolicyLoader, SafeLoader
+    
+    console = _console()
     try:
         # Load policy (auto-detect format)
         if input_file.suffix.lower() in ['.yml', '.yaml']:
             with open(input_file, 'r') as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=SafeLoader)
         else:
             with open(input_file, 'r') as f:
                 data = json.load(f)
@@ -227,8 +253,11 @@ def convert(
         
         # Save in requested format
         if format.lower() == 'json':
-            with open(output_file, 'w') as f:
-                json.dump(policy_config.model_dump(exclude_none=True), f, indent=2)
+            # pydantic's native serializer skips the dict round-trip
+            output_file.write_text(
+                policy_config.model_dump_json(exclude_none=True, indent=2),
+                encoding="utf-8",
+            )
         else:
             PolicyLoader.save_to_file(policy_config, output_file)
         
@@ -243,7 +272,7 @@ def convert(
 def version():
     """Show version information."""
     from . import __version__
-    console.print(f"MCP Auth Guard v{__version__}")
+    typer.echo(f"MCP Auth Guard v{__version__}")
 
 
 if __name__ == "__main__":
@@ -1,13 +1,43 @@
-"""Identity management for MCP Auth Guard."""
+"""Identity management for MCP Auth Guard.
 
-from .manager import IdentityManager
-from .jwt_auth import JWTAuthenticator
-from .api_key_auth import APIKeyAuthenticator
-from .header_auth import HeaderAuthenticator
+Authenticators are imported on first access, so using one (e.g.
+HeaderAuthenticator) does not import the JWT library.
+"""
 
-__all__ = [
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .manager import IdentityManager
+    from .jwt_auth import JWTAuthenticator
+    from .api_key_auth import APIKeyAuthenticator
+    from .header_auth import HeaderAuthenticator
+
+__all__ = (
     "IdentityManager",
     "JWTAuthenticator", 
     "APIKeyAuthenticator",
     "HeaderAuthenticator",
-]
+)
+
+# Public name -> submodule that defines it
+_LAZY = {
+    "IdentityManager": ".manager",
+    "JWTAuthenticator": ".jwt_auth",
+    "APIKeyAuthenticator": ".api_key_auth",
+    "HeaderAuthenticator": ".header_auth",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    # Cache on the module so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
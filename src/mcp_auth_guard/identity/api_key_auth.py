@@ -1,5 +1,7 @@
 """API key-based authentication."""
 
+import hashlib
+import hmac
 import logging
 from typing import Dict
 
@@ -7,23 +9,50 @@ from ..schemas.auth import AuthConfig, AuthContext, AuthMethod
 
 logger = logging.getLogger(__name__)
 
+# Roles for a valid key that has no entry in api_key_roles
+DEFAULT_ROLES = ("api_user",)
+
+
+def _digest(api_key: str) -> bytes:
+    return hashlib.sha256(api_key.encode()).digest()
+
 
 class APIKeyAuthenticator:
     """Handles API key-based authentication."""
     
+    __slots__ = (
+        "config", "valid_keys", "_key_digests", "_api_key_header", "_roles_map",
+        "_fallback_user_ids", "_context_cache",
+    )
+    
     def __init__(self, config: AuthConfig):
         """Initialize API key authenticator."""
         self.config = config
+        # Headers arrive with lowercased names
+        self._api_key_header = config.api_key_header.lower()
         
-        # Use api_key_roles as source of truth if available, fallback to api_keys
-        if config.api_key_roles:
-            self.valid_keys = set(config.api_key_roles.keys())
-        elif config.api_keys:
-            self.valid_keys = set(config.api_keys)
-        else:
+        # Keys are valid when listed in api_keys or mapped in api_key_roles;
+        # listed keys without a mapping get the default role
+        if not (config.api_key_roles or config.api_keys):
             raise ValueError("Either api_keys or api_key_roles is required for API key authentication")
+        self.valid_keys = frozenset(config.api_keys or ()).union(config.api_key_roles or ())
+        # Presented keys are looked up by digest, so their characters are never
+        # compared against stored keys in variable time
+        self._key_digests = {_digest(api_key): api_key for api_key in self.valid_keys}
+        # Roles are shared by every context built for a key, so keep them immutable
+        self._roles_map = {
+            api_key: tuple(roles) for api_key, roles in (config.api_key_roles or {}).items()
+        }
+        # Fallback user id per valid key, built on first use
+        self._fallback_user_ids: Dict[str, str] = {}
+        # Context per valid key for requests without identity override headers
+        self._context_cache: Dict[str, AuthContext] = {}
     
     async def authenticate(self, headers: Dict[str, str]) -> AuthContext:
+        """Authenticate a request; see authenticate_sync."""
+        return self.authenticate_sync(headers)
+    
+    def authenticate_sync(self, headers: Dict[str, str]) -> AuthContext:
         """
         Authenticate using API key from configured header.
         
@@ -33,25 +62,64 @@ class APIKeyAuthenticator:
         Returns:
             AuthContext with API key information
         """
-        api_key = headers.get(self.config.api_key_header.lower())
+        api_key = headers.get(self._api_key_header)
         if not api_key:
             raise ValueError(f"Missing {self.config.api_key_header} header")
         
-        if api_key not in self.valid_keys:
+        stored_key = self._key_digests.get(_digest(api_key))
+        if stored_key is None or not hmac.compare_digest(stored_key.encode(), api_key.encode()):
             raise ValueError("Invalid API key")
         
         # Extract additional information from headers
-        user_id = headers.get("x-user-id", f"api_key_user_{hash(api_key) % 10000}")
-        agent_id = headers.get("x-agent-id", "api_key_agent")
+        user_id = headers.get("x-user-id")
+        agent_id = headers.get("x-agent-id")
+        if user_id is None and agent_id is None:
+            # The context depends only on the key; build it once and share it
+            context = self._context_cache.get(api_key)
+            if context is None:
+                context = self._context_cache[api_key] = self._build_context(
+                    api_key, self._fallback_user_id(api_key), "api_key_agent"
+                )
+            return context
         
-        # Get roles from config mapping instead of trusting headers
-        if self.config.api_key_roles and api_key in self.config.api_key_roles:
-            roles = self.config.api_key_roles[api_key]
-        else:
-            # Fallback to default role if no mapping exists
-            roles = ["api_user"]
+        return self._build_context(
+            api_key,
+            self._fallback_user_id(api_key) if user_id is None else user_id,
+            "api_key_agent" if agent_id is None else agent_id,
+        )
+    
+    def invalidate(self, api_key: str) -> bool:
+        """
+        Revoke an API key and drop everything cached for it.
+        
+        Args:
+            api_key: Key to revoke
+            
+        Returns:
+            True if the key was valid
+        """
+        if api_key not in self.valid_keys:
+            return False
+        self.valid_keys = self.valid_keys - {api_key}
+        self._key_digests.pop(_digest(api_key), None)
+        self._context_cache.pop(api_key, None)
+        self._fallback_user_ids.pop(api_key, None)
+        return True
+    
+    def _fallback_user_id(self, api_key: str) -> str:
+        """Get the user id for a key that was sent without X-User-ID."""
+        user_id = self._fallback_user_ids.get(api_key)
+        if user_id is None:
+            user_id = self._fallback_user_ids[api_key] = f"api_key_user_{hash(api_key) % 10000}"
+        return user_id
+    
+    def _build_context(self, api_key: str, user_id: str, agent_id: str) -> AuthContext:
+        """Build the context for a validated key."""
+        # Get roles from config mapping instead of trusting headers, falling
+        # back to the default role if no mapping exists
+        roles = self._roles_map.get(api_key, DEFAULT_ROLES)
         
-        return AuthContext(
+        return AuthContext.trusted(
             authenticated=True,
             auth_method=AuthMethod.API_KEY,
             user_id=user_id,
@@ -1,16 +1,25 @@
 """Header-based authentication (simple extraction)."""
 
 import logging
-from typing import Dict
+from functools import lru_cache
+from typing import Dict, Tuple
 
 from ..schemas.auth import AuthConfig, AuthContext, AuthMethod
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1024)
+def _parse_roles(roles_str: str) -> Tuple[str, ...]:
+    """Split a comma-separated roles header, dropping blank entries."""
+    return tuple(role for role in (part.strip() for part in roles_str.split(",")) if role)
+
+
 class HeaderAuthenticator:
     """Handles header-based authentication."""
     
+    __slots__ = ("config", "header_mapping", "_header_pairs")
+    
     def __init__(self, config: AuthConfig):
         """Initialize header authenticator."""
         self.config = config
@@ -19,8 +28,17 @@ class HeaderAuthenticator:
             "x-agent-id": "agent_id", 
             "x-user-roles": "roles"
         }
+        # (lowercased header name, claim name) pairs, matching how headers arrive
+        self._header_pairs = tuple(
+            (header_name.lower(), attr_name)
+            for header_name, attr_name in self.header_mapping.items()
+        )
     
     async def authenticate(self, headers: Dict[str, str]) -> AuthContext:
+        """Authenticate a request; see authenticate_sync."""
+        return self.authenticate_sync(headers)
+    
+    def authenticate_sync(self, headers: Dict[str, str]) -> AuthContext:
         """
         Authenticate by extracting information from headers.
         
@@ -32,22 +50,24 @@ class HeaderAuthenticator:
         """
         # Extract mapped information
         claims = {}
-        for header_name, attr_name in self.header_mapping.items():
-            value = headers.get(header_name.lower())
+        for header_name, attr_name in self._header_pairs:
+            value = headers.get(header_name)
             if value:
                 claims[attr_name] = value
         
         # Parse roles if present
-        roles = []
         roles_str = claims.get("roles", "")
-        if roles_str:
-            roles = [role.strip() for role in roles_str.split(",") if role.strip()]
+        roles = _parse_roles(roles_str) if roles_str else ()
         
-        user_id = claims.get("user_id", "unknown")
+        # Empty header values are never collected, so presence means identity
+        user_id = claims.get("user_id")
+        authenticated = user_id is not None
+        if not authenticated:
+            user_id = "unknown"
         agent_id = claims.get("agent_id", "unknown")
         
-        return AuthContext(
-            authenticated=bool(user_id and user_id != "unknown"),
+        return AuthContext.trusted(
+            authenticated=authenticated,
             auth_method=AuthMethod.HEADER_BASED,
             user_id=user_id,
             roles=roles,
@@ -1,6 +1,10 @@
 """JWT-based authentication."""
 
+import hashlib
 import logging
+import threading
+import time
+from collections import OrderedDict
 from typing import Dict, Any
 import jwt
 from jwt.exceptions import InvalidTokenError
@@ -13,13 +17,77 @@ logger = logging.getLogger(__name__)
 class JWTAuthenticator:
     """Handles JWT-based authentication."""
     
+    __slots__ = ("config", "_required_claims", "_payload_cache", "_cache_lock")
+    
+    # Verified payloads are kept per token until the token expires, but never
+    # longer than PAYLOAD_CACHE_TTL seconds (tokens without exp included)
+    PAYLOAD_CACHE_SIZE = 10_000
+    PAYLOAD_CACHE_TTL = 300
+    
     def __init__(self, config: AuthConfig):
         """Initialize JWT authenticator."""
         self.config = config
         if not config.jwt_secret:
             raise ValueError("JWT secret is required for JWT authentication")
+        self._required_claims = frozenset(config.required_claims)
+        
+        # Token digest -> (expires at, verified payload)
+        self._payload_cache: "OrderedDict[bytes, tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+    
+    @staticmethod
+    def _cache_key(token: str) -> bytes:
+        return hashlib.blake2b(token.encode(), digest_size=16).digest()
+    
+    def invalidate(self, token: str) -> bool:
+        """
+        Forget the cached verification of a token so it is checked again.
+        
+        Args:
+            token: Raw JWT, without the Bearer prefix
+            
+        Returns:
+            True if a verification was cached
+        """
+        with self._cache_lock:
+            return self._payload_cache.pop(self._cache_key(token), None) is not None
+    
+    def _decode(self, token: str) -> Dict[str, Any]:
+        """Verify a token, reusing the payload of an earlier successful check."""
+        key = self._cache_key(token)
+        now = time.time()
+        with self._cache_lock:
+            cached = self._payload_cache.get(key)
+            if cached is not None:
+                if cached[0] > now:
+                    self._payload_cache.move_to_end(key)
+                    return cached[1]
+                del self._payload_cache[key]
+        
+        payload = jwt.decode(
+            token,
+            self.config.jwt_secret,
+            algorithms=[self.config.jwt_algorithm],
+            audience=self.config.jwt_audience,
+            issuer=self.config.jwt_issuer,
+        )
+        
+        # Only successful verifications are cached
+        expires_at = now + self.PAYLOAD_CACHE_TTL
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)):
+            expires_at = min(expires_at, exp)
+        with self._cache_lock:
+            self._payload_cache[key] = (expires_at, payload)
+            if len(self._payload_cache) > self.PAYLOAD_CACHE_SIZE:
+                self._payload_cache.popitem(last=False)
+        return payload
     
     async def authenticate(self, headers: Dict[str, str]) -> AuthContext:
+        """Authenticate a request; see authenticate_sync."""
+        return self.authenticate_sync(headers)
+    
+    def authenticate_sync(self, headers: Dict[str, str]) -> AuthContext:
         """
         Authenticate using JWT token from Authorization header.
         
@@ -30,32 +98,27 @@ class JWTAuthenticator:
             AuthContext with JWT claims
         """
         auth_header = headers.get("authorization", "")
-        if not auth_header.startswith("Bearer "):
+        token = auth_header.removeprefix("Bearer ")
+        # removeprefix returns the same object when the prefix is absent
+        if token is auth_header or not token:
             raise ValueError("Missing or invalid Authorization header")
         
-        token = auth_header[7:]  # Remove "Bearer " prefix
-        
         try:
             # Decode and verify JWT
-            payload = jwt.decode(
-                token,
-                self.config.jwt_secret,
-                algorithms=[self.config.jwt_algorithm],
-                audience=self.config.jwt_audience,
-                issuer=self.config.jwt_issuer,
-            )
+            payload = self._decode(token)
             
             # Validate required claims
-            for claim in self.config.required_claims:
-                if claim not in payload:
-                    raise ValueError(f"Missing required claim: {claim}")
+            missing = self._required_claims.difference(payload)
+            if missing:
+                raise ValueError(f"Missing required claims: {', '.join(sorted(missing))}")
             
             # Extract user information
             user_id = payload.get("sub", payload.get("user_id"))
             roles = payload.get("roles", [])
             if isinstance(roles, str):
-                roles = [roles]
+                roles = (roles,)
             
+            # Claims come from the token, so the context is validated
             return AuthContext(
                 authenticated=True,
                 auth_method=AuthMethod.JWT,
@@ -67,5 +130,5 @@ class JWTAuthenticator:
             )
             
         except InvalidTokenError as e:
-            logger.warning(f"Invalid JWT token: {e}")
+            logger.warning("Invalid JWT token: %s", e)
             raise ValueError(f"Invalid JWT token: {e}")
@@ -10,32 +10,63 @@ from .header_auth import HeaderAuthenticator
 
 logger = logging.getLogger(__name__)
 
+# Authenticator class for each method that needs one
+_AUTHENTICATORS = {
+    AuthMethod.JWT: JWTAuthenticator,
+    AuthMethod.API_KEY: APIKeyAuthenticator,
+    AuthMethod.HEADER_BASED: HeaderAuthenticator,
+}
+
 
 class IdentityManager:
     """Manages authentication for MCP requests."""
     
+    __slots__ = (
+        "config", "_auth_required", "_authenticator", "_anonymous_context",
+        "_unauthenticated_context",
+    )
+    
     def __init__(self, config: AuthConfig):
         """Initialize the identity manager with authentication config."""
         self.config = config
+        self._auth_required = config.method != AuthMethod.NONE
         self._authenticator = self._create_authenticator()
+        
+        # Shared context for unauthenticated servers; requests only vary it
+        # by agent id
+        self._anonymous_context = AuthContext.trusted(
+            authenticated=True,
+            auth_method=AuthMethod.NONE,
+            user_id="anonymous",
+            agent_id="unknown"
+        )
+        # Every failed authentication yields the same context, so share one
+        # instead of filling empty roles and claims per request
+        self._unauthenticated_context = AuthContext.trusted(
+            authenticated=False,
+            auth_method=config.method
+        )
     
     def _create_authenticator(self):
         """Create the appropriate authenticator based on config."""
-        if self.config.method == AuthMethod.JWT:
-            return JWTAuthenticator(self.config)
-        elif self.config.method == AuthMethod.API_KEY:
-            return APIKeyAuthenticator(self.config)
-        elif self.config.method == AuthMethod.HEADER_BASED:
-            return HeaderAuthenticator(self.config)
-        elif self.config.method == AuthMethod.NONE:
+        if not self._auth_required:
             return None
-        else:
+        authenticator_class = _AUTHENTICATORS.get(self.config.method)
+        if authenticator_class is None:
             raise ValueError(f"Unsupported auth method: {self.config.method}")
+        return authenticator_class(self.config)
     
     async def authenticate(self, headers: Dict[str, str]) -> AuthContext:
+        """Authenticate a request; see authenticate_sync."""
+        return self.authenticate_sync(headers)
+    
+    def authenticate_sync(self, headers: Dict[str, str]) -> AuthContext:
         """
         Authenticate a request based on headers.
         
+        Every authenticator is pure CPU work, so this runs without a
+        coroutine; authenticate() wraps it for async callers.
+        
         Args:
             headers: HTTP headers from the request
             
@@ -44,22 +75,17 @@ class IdentityManager:
         """
         if self._authenticator is None:
             # No authentication required
-            return AuthContext(
-                authenticated=True,
-                auth_method=AuthMethod.NONE,
-                user_id="anonymous",
-                agent_id=headers.get("x-agent-id", "unknown")
-            )
+            agent_id = headers.get("x-agent-id")
+            if agent_id is None:
+                return self._anonymous_context
+            return self._anonymous_context.model_copy(update={"agent_id": agent_id})
         
         try:
-            return await self._authenticator.authenticate(headers)
+            return self._authenticator.authenticate_sync(headers)
         except Exception as e:
-            logger.warning(f"Authentication failed: {e}")
-            return AuthContext(
-                authenticated=False,
-                auth_method=self.config.method
-            )
+            logger.warning("Authentication failed: %s", e)
+            return self._unauthenticated_context
     
     def is_authentication_required(self) -> bool:
         """Check if authentication is required."""
-        return self.config.method != AuthMethod.NONE
+        return self._auth_required
@@ -11,13 +11,22 @@ from mcp import types
 
 from ..identity import IdentityManager
 from ..policy import PolicyEngine, PolicyLoader
-from ..schemas.auth import AuthConfig, AuthMethod
+from ..schemas.auth import AuthConfig, AuthContext, AuthMethod
 from ..schemas.policy import PolicyConfig
 from ..schemas.resource import ToolResource, ResourceContext
-from ..schemas.response import DecisionReason
 
 logger = logging.getLogger(__name__)
 
+# Resource type of each MCP method the middleware hooks
+_METHOD_TO_TYPE = {
+    "tools/call": "tools",
+    "tools/list": "tools",
+    "resources/read": "resources",
+    "resources/list": "resources",
+    "prompts/get": "prompts",
+    "prompts/list": "prompts",
+}
+
 
 class AuthGuardMiddleware(Middleware):
     """
@@ -31,6 +40,9 @@ class AuthGuardMiddleware(Middleware):
     - Audit logging
     """
     
+    # Attribute of the per-request FastMCP context holding its authentication
+    AUTH_STATE_ATTR = "_mcp_auth_guard_auth"
+    
     def __init__(
         self,
         auth_config: Optional[AuthConfig] = None,
@@ -79,25 +91,36 @@ class AuthGuardMiddleware(Middleware):
         else:
             raise ValueError("Policies must be a list, file path, or directory path")
     
-    async def _authenticate_request(self) -> tuple:
-        """Authenticate the current request."""
-        headers = get_http_headers()
+    async def _authenticate_request(self, context: Optional[MiddlewareContext] = None) -> AuthContext:
+        """Authenticate the current request.
+        
+        The result is remembered on the request's FastMCP context, so hooks
+        that run for the same request authenticate it only once.
+        """
+        fastmcp_context = context.fastmcp_context if context is not None else None
+        cached = getattr(fastmcp_context, self.AUTH_STATE_ATTR, None)
+        if cached is not None:
+            return cached
         
-        # Convert headers to lowercase for case-insensitive lookup
-        headers_lower = {k.lower(): v for k, v in headers.items()}
+        # FastMCP already lowercases header names, which is the form the
+        # authenticators look names up in
+        headers = get_http_headers()
         
-        auth_context = await self.identity_manager.authenticate(headers_lower)
+        auth_context = self.identity_manager.authenticate_sync(headers)
         
         if self.enable_audit_logging:
             if auth_context.authenticated:
                 logger.info(
-                    f"Authenticated user: {auth_context.user_id} "
-                    f"(method: {auth_context.auth_method})"
+                    "Authenticated user: %s (method: %s)",
+                    auth_context.user_id,
+                    auth_context.auth_method,
                 )
             else:
-                logger.warning(f"Authentication failed for request")
+                logger.warning("Authentication failed for request")
         
-        return auth_context, headers_lower
+        if fastmcp_context is not None:
+            setattr(fastmcp_context, self.AUTH_STATE_ATTR, auth_context)
+        return auth_context
     
     def _extract_tool_resource(self, context: MiddlewareContext, component) -> ToolResource:
         """Extract tool resource information from MCP context."""
@@ -132,8 +155,9 @@ class AuthGuardMiddleware(Middleware):
         tool_resource = self._extract_tool_resource(context, component)
         
         # Determine resource type from method
-        method_parts = context.method.split("/")
-        resource_type = method_parts[0] if method_parts else "unknown"
+        resource_type = _METHOD_TO_TYPE.get(context.method)
+        if resource_type is None:
+            resource_type = context.method.partition("/")[0]
         
         # Handle timestamp conversion from datetime to float
         timestamp = getattr(context, 'timestamp', None)
@@ -157,27 +181,25 @@ class AuthGuardMiddleware(Middleware):
         action: str
     ):
         """Authorize a request and raise error if denied."""
-        auth_context, headers = await self._authenticate_request()
+        auth_context = await self._authenticate_request(context)
         resource_context = self._create_resource_context(context, component, action)
         
         # Evaluate authorization
         decision = await self.policy_engine.evaluate(auth_context, resource_context)
         
         # Log the decision
+        # Arguments are formatted by logging only if the record is emitted
         if self.enable_audit_logging:
-            log_msg = (
-                f"Authorization {('ALLOWED' if decision.allowed else 'DENIED')} - "
-                f"User: {auth_context.user_id}, Tool: {component.name}, "
-                f"Action: {action}, Reason: {decision.reason}"
+            logger.log(
+                logging.INFO if decision.allowed else logging.WARNING,
+                "Authorization %s - User: %s, Tool: %s, Action: %s, Reason: %s%s",
+                "ALLOWED" if decision.allowed else "DENIED",
+                auth_context.user_id,
+                component.name,
+                action,
+                decision.reason,
+                f", Rule: {decision.matched_rule}" if decision.matched_rule else "",
             )
-            
-            if decision.matched_rule:
-                log_msg += f", Rule: {decision.matched_rule}"
-            
-            if decision.allowed:
-                logger.info(log_msg)
-            else:
-                logger.warning(log_msg)
         
         # Raise error if access denied
         if not decision.allowed:
@@ -194,28 +216,42 @@ class AuthGuardMiddleware(Middleware):
         if not components:
             return []
         
-        auth_context, headers = await self._authenticate_request()
-        authorized_components = []
+        auth_context = await self._authenticate_request(context)
         
+        candidates = []
+        resource_contexts = []
         for component in components:
             try:
-                resource_context = self._create_resource_context(context, component, action)
-                decision = await self.policy_engine.evaluate(auth_context, resource_context)
-                
-                if decision.allowed:
-                    authorized_components.append(component)
-                
-                if self.enable_audit_logging:
-                    result = "ALLOWED" if decision.allowed else "FILTERED"
-                    logger.debug(
-                        f"Component {result} - Tool: {component.name}, "
-                        f"User: {auth_context.user_id}, Reason: {decision.reason}"
-                    )
-                    
+                resource_contexts.append(
+                    self._create_resource_context(context, component, action)
+                )
+                candidates.append(component)
             except Exception as e:
-                logger.error(f"Error evaluating component {component.name}: {e}")
+                logger.error("Error evaluating component %s: %s", component.name, e)
                 # Exclude component on error (fail secure)
         
+        try:
+            decisions = await self.policy_engine.evaluate_batch(auth_context, resource_contexts)
+        except Exception as e:
+            logger.error("Error evaluating components: %s", e)
+            # Exclude all components on error (fail secure)
+            return []
+        
+        authorized_components = []
+        log_components = self.enable_audit_logging and logger.isEnabledFor(logging.DEBUG)
+        for component, decision in zip(candidates, decisions):
+            if decision.allowed:
+                authorized_components.append(component)
+            
+            if log_components:
+                logger.debug(
+                    "Component %s - Tool: %s, User: %s, Reason: %s",
+                    "ALLOWED" if decision.allowed else "FILTERED",
+                    component.name,
+                    auth_context.user_id,
+                    decision.reason,
+                )
+        
         return authorized_components
     
     # FastMCP middleware hooks
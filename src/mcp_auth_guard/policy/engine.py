@@ -2,12 +2,15 @@
 
 import logging
 import time
+from collections import OrderedDict
+from typing import Optional
 
 from ..schemas.auth import AuthContext
 from ..schemas.policy import PolicyConfig
 from ..schemas.resource import ResourceContext
 from ..schemas.response import AuthDecision, DecisionReason
 from .evaluator import PolicyEvaluator
+from .index import RuleIndex
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +18,9 @@ logger = logging.getLogger(__name__)
 class PolicyEngine:
     """Main policy engine for authorization decisions."""
 
+    # Maximum number of cached authorization decisions
+    DECISION_CACHE_SIZE = 10_000
+
     def __init__(self, policies: list[PolicyConfig]):
         """
         Initialize policy engine with a list of policies.
@@ -25,6 +31,11 @@ class PolicyEngine:
         self.policies = policies
         self.evaluator = PolicyEvaluator()
 
+        # Decisions keyed by identity and capability, in LRU order. A None
+        # value marks a capability whose rules have conditions and must
+        # always be evaluated.
+        self._decision_cache: "OrderedDict[tuple, Optional[AuthDecision]]" = OrderedDict()
+
         # Sort policies by priority (higher priority first)
         self._sort_policies()
 
@@ -34,6 +45,29 @@ class PolicyEngine:
         """Sort policies and rules by priority."""
         for policy in self.policies:
             policy.rules.sort(key=lambda r: r.priority, reverse=True)
+        self._build_index()
+
+    def _build_index(self):
+        """Rebuild the rule index and other state derived from the policies."""
+        rules = [rule for policy in self.policies for rule in policy.rules]
+        self._index = RuleIndex(rules)
+        # First policy of each name, as a linear search would find it
+        self._policy_by_name: dict[str, PolicyConfig] = {}
+        for policy in self.policies:
+            self._policy_by_name.setdefault(policy.name, policy)
+        self.evaluator.compile_rules(rules)
+        # Requests matching no rule are allowed if any policy defaults to allow
+        self._any_default_allow = any(
+            (
+                p.default_effect.value
+                if hasattr(p.default_effect, "value")
+                else p.default_effect
+            )
+            == "allow"
+            for p in self.policies
+        )
+        # Every policy change goes through here, so cached decisions are stale
+        self._decision_cache.clear()
 
     async def evaluate(
         self, auth_context: AuthContext, resource_context: ResourceContext
@@ -48,8 +82,7 @@ class PolicyEngine:
         Returns:
             Authorization decision
         """
-        start_time = time.time()
-        evaluated_rules = 0
+        start_ns = time.perf_counter_ns()
 
         logger.debug(
             f"Evaluating authorization for user {auth_context.user_id} "
@@ -58,53 +91,146 @@ class PolicyEngine:
 
         # Check if authentication is required and valid
         if not auth_context.authenticated:
-            return AuthDecision(
-                allowed=False,
-                reason=DecisionReason.AUTHENTICATION_FAILED,
-                message="Authentication required",
-                evaluated_rules=0,
-                evaluation_time_ms=(time.time() - start_time) * 1000,
-            )
+            return self._authentication_failed(start_ns)
 
-        # Evaluate each policy
-        for policy in self.policies:
-            for rule in policy.rules:
-                evaluated_rules += 1
-
-                # Check if rule matches
-                if await self.evaluator.evaluate_rule(
-                    rule, auth_context, resource_context
-                ):
-                    elapsed_ms = (time.time() - start_time) * 1000
-
-                    logger.debug(
-                        f"Rule '{rule.name}' matched with effect: {rule.effect}"
-                    )
-
-                    return AuthDecision(
-                        allowed=(rule.effect.value == "allow"),
-                        reason=DecisionReason.RULE_MATCHED,
-                        matched_rule=rule.name,
-                        message=f"Matched rule: {rule.name}",
-                        evaluated_rules=evaluated_rules,
-                        evaluation_time_ms=elapsed_ms,
-                    )
+        return self._decide(auth_context, resource_context, start_ns)
 
-        # No rules matched, use default effect
-        elapsed_ms = (time.time() - start_time) * 1000
-        default_allowed = any(
-            (
-                p.default_effect.value
-                if hasattr(p.default_effect, "value")
-                else p.default_effect
-            )
-            == "allow"
-            for p in self.policies
+    async def evaluate_batch(
+        self,
+        auth_context: AuthContext,
+        resource_contexts: list[ResourceContext],
+    ) -> list[AuthDecision]:
+        """
+        Evaluate authorization for several resources accessed by one identity.
+
+        The authentication check is resolved once for the whole batch.
+
+        Args:
+            auth_context: Authentication context
+            resource_contexts: Resources being accessed
+
+        Returns:
+            Authorization decisions, in the order of ``resource_contexts``
+        """
+        start_ns = time.perf_counter_ns()
+
+        logger.debug(
+            f"Evaluating authorization for user {auth_context.user_id} "
+            f"accessing {len(resource_contexts)} resources"
+        )
+
+        if not auth_context.authenticated:
+            decision = self._authentication_failed(start_ns)
+            return [decision] * len(resource_contexts)
+
+        return [
+            self._decide(auth_context, resource_context, time.perf_counter_ns())
+            for resource_context in resource_contexts
+        ]
+
+    # Decisions are built with model_construct: every field comes from the
+    # engine itself, so pydantic validation would only repeat known types.
+
+    @staticmethod
+    def _authentication_failed(start_ns: int) -> AuthDecision:
+        return AuthDecision.model_construct(
+            allowed=False,
+            reason=DecisionReason.AUTHENTICATION_FAILED,
+            message="Authentication required",
+            evaluated_rules=0,
+            evaluation_time_ms=(time.perf_counter_ns() - start_ns) / 1e6,
+        )
+
+    @staticmethod
+    def _decision_key(auth_context: AuthContext, resource_context: ResourceContext) -> tuple:
+        """Key a decision by identity and capability."""
+        resource = resource_context.resource
+        return (
+            auth_context.user_id,
+            auth_context.agent_id,
+            tuple(auth_context.roles),
+            resource_context.resource_type,
+            resource_context.action,
+            resource.name,
+            resource.namespace,
+            tuple(resource.tags),
+        )
+
+    def _decide(
+        self,
+        auth_context: AuthContext,
+        resource_context: ResourceContext,
+        start_ns: int,
+    ) -> AuthDecision:
+        """Decide an authenticated request, reusing earlier decisions where possible."""
+        key = self._decision_key(auth_context, resource_context)
+        cache = self._decision_cache
+        if key in cache:
+            cache.move_to_end(key)
+            decision = cache[key]
+            if decision is not None:
+                # The cached timing and rule count describe the request that
+                # built it; report this request's lookup instead
+                return decision.model_copy(
+                    update={
+                        "evaluated_rules": 0,
+                        "evaluation_time_ms": (time.perf_counter_ns() - start_ns) / 1e6,
+                    }
+                )
+            return self._evaluate_rules(auth_context, resource_context, start_ns)
+
+        decision = self._evaluate_rules(auth_context, resource_context, start_ns)
+        cacheable = self.is_cacheable(
+            resource_context.resource_type, resource_context.resource.name
+        )
+        cache[key] = decision if cacheable else None
+        if len(cache) > self.DECISION_CACHE_SIZE:
+            cache.popitem(last=False)
+        return decision
+
+    def _evaluate_rules(
+        self,
+        auth_context: AuthContext,
+        resource_context: ResourceContext,
+        start_ns: int,
+    ) -> AuthDecision:
+        """Decide an authenticated request from the rules, or the default effect."""
+        evaluated_rules = 0
+
+        # Evaluate the rules that can match this capability, in priority order
+        candidates = self._index.candidates(
+            resource_context.resource_type,
+            resource_context.resource.name,
+            resource_context.action,
         )
+        # Condition context, built by the first rule that needs it
+        context_data: dict = {}
+        for rule in candidates:
+            evaluated_rules += 1
+
+            # Check if rule matches
+            if self.evaluator.evaluate_rule(
+                rule, auth_context, resource_context, context_data
+            ):
+                elapsed_ms = (time.perf_counter_ns() - start_ns) / 1e6
+
+                logger.debug("Rule '%s' matched with effect: %s", rule.name, rule.effect)
 
-        logger.debug(f"No rules matched, using default effect: {default_allowed}")
+                return AuthDecision.model_construct(
+                    allowed=(rule.effect.value == "allow"),
+                    reason=DecisionReason.RULE_MATCHED,
+                    matched_rule=rule.name,
+                    message=f"Matched rule: {rule.name}",
+                    evaluated_rules=evaluated_rules,
+                    evaluation_time_ms=elapsed_ms,
+                )
 
-        return AuthDecision(
+        # No rules matched, use default effect
+        elapsed_ms = (time.perf_counter_ns() - start_ns) / 1e6
+        default_allowed = self._any_default_allow
+        logger.debug("No rules matched, using default effect: %s", default_allowed)
+
+        return AuthDecision.model_construct(
             allowed=default_allowed,
             reason=DecisionReason.DEFAULT_EFFECT,
             message="No matching rules, using default effect",
@@ -112,6 +238,25 @@ class PolicyEngine:
             evaluation_time_ms=elapsed_ms,
         )
 
+    def is_cacheable(self, resource_type: str, name: str) -> bool:
+        """
+        Check whether decisions for a capability can be reused.
+
+        Decisions are reusable for the same identity when no rule that can
+        match the capability has conditions, since conditions may read
+        arguments, claims or timestamps.
+
+        Args:
+            resource_type: Type of capability (tools, resources, prompts)
+            name: Capability name or resource URI
+
+        Returns:
+            True if the decision depends only on identity and capability
+        """
+        return not any(
+            rule.conditions for rule in self._index.candidates(resource_type, name)
+        )
+
     def add_policy(self, policy: PolicyConfig):
         """Add a new policy to the engine."""
         self.policies.append(policy)
@@ -120,19 +265,21 @@ class PolicyEngine:
 
     def remove_policy(self, policy_name: str) -> bool:
         """Remove a policy by name."""
-        for i, policy in enumerate(self.policies):
-            if policy.name == policy_name:
-                del self.policies[i]
-                logger.info(f"Removed policy: {policy_name}")
-                return True
-        return False
+        # Rebuild even when not found: callers may share and edit the list,
+        # in which case the policy may already be gone from it
+        policy = self._policy_by_name.get(policy_name)
+        if policy is not None:
+            for i, listed in enumerate(self.policies):
+                if listed is policy:
+                    del self.policies[i]
+                    break
+            logger.info(f"Removed policy: {policy_name}")
+        self._build_index()
+        return policy is not None
 
     def get_policy(self, name: str) -> PolicyConfig | None:
         """Get a policy by name."""
-        for policy in self.policies:
-            if policy.name == name:
-                return policy
-        return None
+        return self._policy_by_name.get(name)
 
     def list_policies(self) -> list[str]:
         """List all policy names."""
@@ -1,25 +1,207 @@
 """Policy rule evaluator."""
 
 import logging
+import operator
+import os
 import re
-from fnmatch import fnmatch
-from typing import Any
+from fnmatch import translate
+from functools import lru_cache
+from typing import Any, Callable, Iterable, Optional, Pattern
 
 from ..schemas.auth import AuthContext
 from ..schemas.policy import ConditionOperator, PolicyCondition, PolicyRule
 from ..schemas.resource import ResourceContext
+from .index import _GLOB_CHARS
 
 logger = logging.getLogger(__name__)
 
 
+def _compile_globs(patterns: Iterable[str]) -> Pattern:
+    """Compile fnmatch patterns into one regex matching any of them."""
+    # fnmatch normalizes case through normcase on both sides, so callers must
+    # pass names through _normcase before matching. An empty list compiles to
+    # a pattern that never matches.
+    alternatives = [translate(os.path.normcase(p)) for p in patterns] or ["(?!)"]
+    return re.compile("|".join(alternatives))
+
+
+def _as_list(value) -> Optional[list]:
+    if not value:
+        return None
+    return [value] if isinstance(value, str) else value
+
+
+def _globs(patterns) -> Optional[Pattern]:
+    # Empty or missing lists place no restriction
+    return _compile_globs(patterns) if patterns else None
+
+
+def _members(values) -> Optional[frozenset]:
+    return frozenset(values) if values else None
+
+
+_normcase = os.path.normcase
+
+
+@lru_cache(maxsize=1024)
+def _cached_regex(pattern: str) -> Pattern:
+    return re.compile(pattern)
+
+
+def _regex_match(field: Any, pattern: Pattern | str) -> bool:
+    # Invalid patterns stay strings and fail here, on every evaluation
+    if isinstance(pattern, str):
+        pattern = _cached_regex(pattern)
+    return pattern.match(str(field)) is not None
+
+
+# Comparison for each condition operator, as (field value, condition value)
+_CONDITION_OPERATORS: dict[ConditionOperator, Callable[[Any, Any], bool]] = {
+    ConditionOperator.EQUALS: operator.eq,
+    ConditionOperator.NOT_EQUALS: operator.ne,
+    ConditionOperator.IN: lambda field, value: field in value,
+    ConditionOperator.NOT_IN: lambda field, value: field not in value,
+    ConditionOperator.CONTAINS: lambda field, value: value in str(field),
+    ConditionOperator.NOT_CONTAINS: lambda field, value: value not in str(field),
+    ConditionOperator.STARTS_WITH: lambda field, value: str(field).startswith(value),
+    ConditionOperator.ENDS_WITH: lambda field, value: str(field).endswith(value),
+    ConditionOperator.REGEX: _regex_match,
+    ConditionOperator.GT: operator.gt,
+    ConditionOperator.LT: operator.lt,
+    ConditionOperator.GTE: operator.ge,
+    ConditionOperator.LTE: operator.le,
+}
+
+
+class _CompiledCondition:
+    """A condition with its field path split, operator bound and value prepared."""
+
+    __slots__ = ("field", "field_parts", "operator", "compare", "value")
+
+    def __init__(self, condition: PolicyCondition):
+        self.field = condition.field
+        self.field_parts = tuple(condition.field.split("."))
+        self.operator = condition.operator
+        # None for an unknown operator, which fails every evaluation
+        self.compare = _CONDITION_OPERATORS.get(condition.operator)
+
+        value = condition.value
+        if condition.operator in (ConditionOperator.STARTS_WITH, ConditionOperator.ENDS_WITH):
+            value = str(value)
+        elif condition.operator == ConditionOperator.REGEX:
+            try:
+                # Shared with rules compiled on the fly, which do this per call
+                value = _cached_regex(str(value))
+            except re.error:
+                value = str(value)
+        self.value = value
+
+
+class _CapabilityMatcher:
+    """Compiled tool, resource or prompt matcher."""
+
+    __slots__ = ("names", "patterns", "namespaces", "tags", "schemes")
+
+    def __init__(self, names=None, patterns=None, namespaces=None, tags=None, schemes=None):
+        self.names = _members(names)
+        self.patterns = _globs(patterns)
+        self.namespaces = _members(namespaces)
+        self.tags = _members(tags)
+        self.schemes = _members(schemes)
+
+
+class _CompiledRule:
+    """Matchers of a rule, compiled once instead of on every request."""
+
+    # Sets and patterns are None when the rule places no restriction there
+
+    __slots__ = (
+        "any_action",
+        "action_names",
+        "action_globs",
+        "agent_user_id",
+        "agent_agent_id",
+        "agent_patterns",
+        "agent_roles",
+        "agent_any_role",
+        "any_capability",
+        "capabilities",
+        "conditions",
+    )
+
+    def __init__(self, rule: PolicyRule):
+        # Most rules keep the default ["*"]; literal actions are set lookups
+        # and only real globs go through a regex
+        self.any_action = "*" in rule.actions
+        literal = [a for a in rule.actions if not any(c in a for c in _GLOB_CHARS)]
+        self.action_names = frozenset(_normcase(a) for a in literal)
+        self.action_globs = _globs([a for a in rule.actions if a not in literal])
+
+        agents = rule.agents
+        self.agent_user_id = _globs(agents and _as_list(agents.user_id))
+        self.agent_agent_id = _globs(agents and _as_list(agents.agent_id))
+        self.agent_patterns = _globs(agents and agents.patterns)
+        roles = agents and agents.roles
+        # Wildcard: match any user with at least one role
+        self.agent_any_role = bool(roles) and "*" in roles
+        self.agent_roles = None if self.agent_any_role else _members(roles)
+
+        # Rules without capability matchers apply to every resource type
+        self.any_capability = not (rule.tools or rule.resources or rule.prompts)
+
+        tools = rule.tools and _CapabilityMatcher(
+            rule.tools.names, rule.tools.patterns, rule.tools.namespaces, rule.tools.tags
+        )
+        resources = rule.resources and _CapabilityMatcher(
+            rule.resources.uris, rule.resources.patterns, schemes=rule.resources.schemes
+        )
+        prompts = rule.prompts and _CapabilityMatcher(
+            rule.prompts.names, rule.prompts.patterns, tags=rule.prompts.tags
+        )
+        # Matcher for each resource type; a rule's tool matcher also applies to
+        # resources and prompts when it has no matcher of their own (legacy
+        # compatibility). Types without a matcher never match.
+        self.capabilities: dict[str, Optional[_CapabilityMatcher]] = {
+            "tools": tools,
+            "resources": resources or tools,
+            "prompts": prompts or tools,
+        }
+
+        self.conditions = tuple(_CompiledCondition(c) for c in rule.conditions)
+
+
 class PolicyEvaluator:
     """Evaluates policy rules against request context."""
 
-    async def evaluate_rule(
+    def __init__(self):
+        """Initialize the evaluator with no precompiled rules."""
+        # id(rule) -> (rule, compiled); holding the rule keeps its id unique
+        self._compiled: dict[int, tuple[PolicyRule, _CompiledRule]] = {}
+
+    def compile_rules(self, rules: list[PolicyRule]):
+        """
+        Precompile the matchers of the rules that will be evaluated.
+
+        Replaces any previously compiled rules. Rules evaluated without being
+        compiled here are compiled on each call.
+
+        Args:
+            rules: Rules to precompile
+        """
+        self._compiled = {id(rule): (rule, _CompiledRule(rule)) for rule in rules}
+
+    def _compiled_for(self, rule: PolicyRule) -> _CompiledRule:
+        entry = self._compiled.get(id(rule))
+        if entry is not None and entry[0] is rule:
+            return entry[1]
+        return _CompiledRule(rule)
+
+    def evaluate_rule(
         self,
         rule: PolicyRule,
         auth_context: AuthContext,
         resource_context: ResourceContext,
+        context_data: Optional[dict] = None,
     ) -> bool:
         """
         Evaluate if a rule matches the given context.
@@ -28,206 +210,111 @@ class PolicyEvaluator:
             rule: Policy rule to evaluate
             auth_context: Authentication context
             resource_context: Resource context
+            context_data: Condition context to share between the rules of one
+                request. An empty dict is filled in the first time a rule
+                needs it; when None, the context is built for this rule only.
 
         Returns:
             True if rule matches, False otherwise
         """
+        compiled = self._compiled_for(rule)
+
         # Check action match
-        if not self._matches_action(rule.actions, resource_context.action):
+        if not self._matches_action(compiled, resource_context.action):
             return False
 
         # Check agent match
-        if rule.agents and not self._matches_agent(rule.agents, auth_context):
+        if rule.agents and not self._matches_agent(compiled, auth_context):
             return False
 
         # Check capability match based on resource type
-        capability_matches = False
-        
-        # If rule has tools and this is a tool, check tool match
-        if rule.tools and resource_context.resource_type == "tools":
-            capability_matches = self._matches_tool(rule.tools, resource_context)
-        
-        # If rule has resources and this is a resource, check resource match  
-        elif rule.resources and resource_context.resource_type == "resources":
-            capability_matches = self._matches_resource(rule.resources, resource_context)
-            
-        # If rule has prompts and this is a prompt, check prompt match
-        elif rule.prompts and resource_context.resource_type == "prompts":
-            capability_matches = self._matches_prompt(rule.prompts, resource_context)
-            
-        # If rule has tools but resource is not a tool (legacy compatibility)
-        elif rule.tools and resource_context.resource_type in ["resources", "prompts"]:
-            capability_matches = self._matches_tool(rule.tools, resource_context)
-            
-        # If no specific matcher for this capability type, skip rule
-        elif not (rule.tools or rule.resources or rule.prompts):
-            capability_matches = True  # No capability restrictions
-        
-        if not capability_matches:
-            return False
+        if not compiled.any_capability:
+            matcher = compiled.capabilities.get(resource_context.resource_type)
+            if matcher is None or not self._matches_capability(
+                matcher, resource_context
+            ):
+                return False
 
         # Check additional conditions
-        if rule.conditions:
-            context_data = self._build_evaluation_context(
-                auth_context, resource_context
-            )
-            for condition in rule.conditions:
+        if compiled.conditions:
+            if context_data is None:
+                context_data = self._build_evaluation_context(
+                    auth_context, resource_context
+                )
+            elif not context_data:
+                context_data.update(
+                    self._build_evaluation_context(auth_context, resource_context)
+                )
+            for condition in compiled.conditions:
                 if not self._evaluate_condition(condition, context_data):
                     return False
 
         return True
 
-    def _matches_action(self, rule_actions: list[str], action: str) -> bool:
+    def _matches_action(self, compiled: _CompiledRule, action: str) -> bool:
         """Check if action matches rule actions."""
-        if "*" in rule_actions:
+        if compiled.any_action:
             return True
+        action = _normcase(action)
+        if action in compiled.action_names:
+            return True
+        globs = compiled.action_globs
+        return globs is not None and globs.match(action) is not None
 
-        for rule_action in rule_actions:
-            if fnmatch(action, rule_action):
-                return True
-
-        return False
-
-    def _matches_agent(self, agent_matcher, auth_context: AuthContext) -> bool:
+    def _matches_agent(self, compiled: _CompiledRule, auth_context: AuthContext) -> bool:
         """Check if agent matches rule criteria."""
+        user_id = _normcase(auth_context.user_id or "")
+        agent_id = _normcase(auth_context.agent_id or "")
+
         # Check user_id
-        if agent_matcher.user_id:
-            user_ids = agent_matcher.user_id
-            if isinstance(user_ids, str):
-                user_ids = [user_ids]
-
-            matched = False
-            for user_id_pattern in user_ids:
-                if fnmatch(auth_context.user_id or "", user_id_pattern):
-                    matched = True
-                    break
-
-            if not matched:
-                return False
+        if compiled.agent_user_id and compiled.agent_user_id.match(user_id) is None:
+            return False
 
         # Check roles
-        if agent_matcher.roles:
-            # Wildcard: match any user with at least one role
-            if "*" in agent_matcher.roles:
-                if not auth_context.roles or len(auth_context.roles) == 0:
-                    return False  # User must have at least one role
-            else:
-                if not any(role in auth_context.roles for role in agent_matcher.roles):
-                    return False
+        if compiled.agent_any_role:
+            if not auth_context.roles:
+                return False  # User must have at least one role
+        elif compiled.agent_roles and compiled.agent_roles.isdisjoint(auth_context.roles):
+            return False
 
         # Check agent_id
-        if agent_matcher.agent_id:
-            agent_ids = agent_matcher.agent_id
-            if isinstance(agent_ids, str):
-                agent_ids = [agent_ids]
-
-            matched = False
-            for agent_id_pattern in agent_ids:
-                if fnmatch(auth_context.agent_id or "", agent_id_pattern):
-                    matched = True
-                    break
-
-            if not matched:
-                return False
+        if compiled.agent_agent_id and compiled.agent_agent_id.match(agent_id) is None:
+            return False
 
         # Check patterns (against user_id and agent_id)
-        if agent_matcher.patterns:
-            matched = False
-            for pattern in agent_matcher.patterns:
-                if fnmatch(auth_context.user_id or "", pattern) or fnmatch(
-                    auth_context.agent_id or "", pattern
-                ):
-                    matched = True
-                    break
-
-            if not matched:
-                return False
+        if compiled.agent_patterns and not (
+            compiled.agent_patterns.match(user_id) or compiled.agent_patterns.match(agent_id)
+        ):
+            return False
 
         return True
 
-    def _matches_tool(self, tool_matcher, resource_context: ResourceContext) -> bool:
-        """Check if tool matches rule criteria."""
-        tool = resource_context.resource
+    def _matches_capability(
+        self, matcher: _CapabilityMatcher, resource_context: ResourceContext
+    ) -> bool:
+        """Check if a tool, resource or prompt matches rule criteria."""
+        resource = resource_context.resource
 
-        # Check exact names
-        if tool_matcher.names:
-            if tool.name not in tool_matcher.names:
-                return False
+        # Check exact names or URIs
+        if matcher.names and resource.name not in matcher.names:
+            return False
 
         # Check patterns
-        if tool_matcher.patterns:
-            matched = False
-            for pattern in tool_matcher.patterns:
-                if fnmatch(tool.name, pattern):
-                    matched = True
-                    break
-
-            if not matched:
-                return False
+        if matcher.patterns and matcher.patterns.match(_normcase(resource.name)) is None:
+            return False
 
         # Check namespaces
-        if tool_matcher.namespaces:
-            if tool.namespace not in tool_matcher.namespaces:
-                return False
+        if matcher.namespaces and resource.namespace not in matcher.namespaces:
+            return False
 
         # Check tags
-        if tool_matcher.tags:
-            if not any(tag in tool.tags for tag in tool_matcher.tags):
-                return False
-
-        return True
-
-    def _matches_resource(self, resource_matcher, resource_context: ResourceContext) -> bool:
-        """Check if resource matches rule criteria."""
-        resource = resource_context.resource
-
-        # Check exact URIs
-        if resource_matcher.uris:
-            if resource.name not in resource_matcher.uris:
-                return False
-
-        # Check URI patterns
-        if resource_matcher.patterns:
-            matched = False
-            for pattern in resource_matcher.patterns:
-                if fnmatch(resource.name, pattern):
-                    matched = True
-                    break
-
-            if not matched:
-                return False
+        if matcher.tags and matcher.tags.isdisjoint(resource.tags):
+            return False
 
         # Check schemes (e.g., user://, admin://, public://)
-        if resource_matcher.schemes:
+        if matcher.schemes:
             resource_scheme = resource.name.split("://")[0] if "://" in resource.name else ""
-            if resource_scheme not in resource_matcher.schemes:
-                return False
-
-        return True
-
-    def _matches_prompt(self, prompt_matcher, resource_context: ResourceContext) -> bool:
-        """Check if prompt matches rule criteria."""
-        prompt = resource_context.resource
-
-        # Check exact names
-        if prompt_matcher.names:
-            if prompt.name not in prompt_matcher.names:
-                return False
-
-        # Check patterns
-        if prompt_matcher.patterns:
-            matched = False
-            for pattern in prompt_matcher.patterns:
-                if fnmatch(prompt.name, pattern):
-                    matched = True
-                    break
-
-            if not matched:
-                return False
-
-        # Check tags
-        if prompt_matcher.tags:
-            if not any(tag in prompt.tags for tag in prompt_matcher.tags):
+            if resource_scheme not in matcher.schemes:
                 return False
 
         return True
@@ -260,54 +347,26 @@ class PolicyEvaluator:
             },
         }
 
-    def _evaluate_condition(self, condition: PolicyCondition, context: dict) -> bool:
+    def _evaluate_condition(self, condition: _CompiledCondition, context: dict) -> bool:
         """Evaluate a single condition against context data."""
+        compare = condition.compare
+        if compare is None:
+            logger.warning("Unknown condition operator: %s", condition.operator)
+            return False
+
         try:
             # Get field value from context
-            field_value = self._get_field_value(condition.field, context)
-            condition_value = condition.value
-
-            # Evaluate based on operator
-            if condition.operator == ConditionOperator.EQUALS:
-                return field_value == condition_value
-            elif condition.operator == ConditionOperator.NOT_EQUALS:
-                return field_value != condition_value
-            elif condition.operator == ConditionOperator.IN:
-                return field_value in condition_value
-            elif condition.operator == ConditionOperator.NOT_IN:
-                return field_value not in condition_value
-            elif condition.operator == ConditionOperator.CONTAINS:
-                return condition_value in str(field_value)
-            elif condition.operator == ConditionOperator.NOT_CONTAINS:
-                return condition_value not in str(field_value)
-            elif condition.operator == ConditionOperator.STARTS_WITH:
-                return str(field_value).startswith(str(condition_value))
-            elif condition.operator == ConditionOperator.ENDS_WITH:
-                return str(field_value).endswith(str(condition_value))
-            elif condition.operator == ConditionOperator.REGEX:
-                return bool(re.match(str(condition_value), str(field_value)))
-            elif condition.operator == ConditionOperator.GT:
-                return field_value > condition_value
-            elif condition.operator == ConditionOperator.LT:
-                return field_value < condition_value
-            elif condition.operator == ConditionOperator.GTE:
-                return field_value >= condition_value
-            elif condition.operator == ConditionOperator.LTE:
-                return field_value <= condition_value
-            else:
-                logger.warning(f"Unknown condition operator: {condition.operator}")
-                return False
-
+            field_value = self._get_field_value(condition.field_parts, context)
+            return compare(field_value, condition.value)
         except Exception as e:
-            logger.warning(f"Error evaluating condition {condition.field}: {e}")
+            logger.warning("Error evaluating condition %s: %s", condition.field, e)
             return False
 
-    def _get_field_value(self, field_path: str, context: dict) -> Any:
-        """Get value from context using dot notation field path."""
-        parts = field_path.split(".")
+    def _get_field_value(self, field_parts: tuple[str, ...], context: dict) -> Any:
+        """Get value from context using a dot notation field path, pre-split."""
         value = context
 
-        for part in parts:
+        for part in field_parts:
             if isinstance(value, dict) and part in value:
                 value = value[part]
             else:
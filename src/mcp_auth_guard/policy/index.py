@@ -0,0 +1,192 @@
+"""Segmented trie index for narrowing the rules that can match a capability."""
+
+import os
+from typing import Iterable
+
+from ..schemas.policy import PolicyRule
+
+# Characters that make an fnmatch pattern non-literal
+_GLOB_CHARS = "*?["
+
+# Separator used to segment capability names of each kind. Resource URIs
+# split on "/" so "user://profile" walks "user:" -> "" -> "profile".
+_SEPARATORS = {
+    "tools": "_",
+    "resources": "/",
+    "prompts": "_",
+}
+
+
+class _TrieNode:
+    """A trie node keyed by name segment."""
+
+    __slots__ = ("children", "prefix_rules", "terminal_rules")
+
+    def __init__(self):
+        self.children: dict[str, "_TrieNode"] = {}
+        # Rules whose literal prefix ends here; they apply to every name below
+        self.prefix_rules: list[int] = []
+        # Rules naming exactly the path to this node
+        self.terminal_rules: list[int] = []
+
+
+class _SegmentTrie:
+    """Maps capability names to candidate rule ordinals."""
+
+    def __init__(self, separator: str):
+        self.separator = separator
+        self.root = _TrieNode()
+
+    def _node(self, segments: Iterable[str]) -> _TrieNode:
+        node = self.root
+        for segment in segments:
+            child = node.children.get(segment)
+            if child is None:
+                child = node.children[segment] = _TrieNode()
+            node = child
+        return node
+
+    def add_exact(self, name: str, ordinal: int):
+        """Index a rule under an exact capability name."""
+        self._node(name.split(self.separator)).terminal_rules.append(ordinal)
+
+    def add_prefix(self, prefix: str, ordinal: int):
+        """Index a rule under every name that starts with ``prefix``."""
+        # Only complete segments are walked; the trailing partial segment
+        # (possibly empty) is left for the evaluator to check.
+        self._node(prefix.split(self.separator)[:-1]).prefix_rules.append(ordinal)
+
+    def add_pattern(self, pattern: str, ordinal: int):
+        """Index a rule under an fnmatch pattern by its literal prefix."""
+        cut = min(
+            (i for i in (pattern.find(c) for c in _GLOB_CHARS) if i != -1),
+            default=-1,
+        )
+        if cut == -1:
+            self.add_exact(pattern, ordinal)
+        else:
+            self.add_prefix(pattern[:cut], ordinal)
+
+    def lookup(self, name: str, found: set[int]):
+        """Add the ordinals of rules that may match ``name`` to ``found``."""
+        node = self.root
+        for segment in name.split(self.separator):
+            found.update(node.prefix_rules)
+            node = node.children.get(segment)
+            if node is None:
+                return
+        found.update(node.prefix_rules)
+        found.update(node.terminal_rules)
+
+
+class RuleIndex:
+    """
+    Index of policy rules by the capability names they can match.
+
+    Rules keep the order they were given in, so candidates come back in
+    evaluation order and first-match semantics are preserved. The index only
+    prunes rules that cannot match; every candidate still goes through the
+    evaluator.
+    """
+
+    def __init__(self, rules: list[PolicyRule]):
+        """
+        Build the index.
+
+        Args:
+            rules: Rules in evaluation order
+        """
+        self.rules = rules
+        self._tries = {kind: _SegmentTrie(sep) for kind, sep in _SEPARATORS.items()}
+        # Rules without capability matchers apply to every resource type
+        self._unrestricted: list[int] = []
+        # Rules by literal action; rules with a glob action apply to every one
+        self._by_action: dict[str, set[int]] = {}
+        self._any_action: set[int] = set()
+
+        for ordinal, rule in enumerate(rules):
+            self._add_actions(rule.actions, ordinal)
+
+            if not (rule.tools or rule.resources or rule.prompts):
+                self._unrestricted.append(ordinal)
+                continue
+
+            if rule.tools:
+                self._add_tool_matcher(self._tries["tools"], rule.tools, ordinal)
+
+            # Tool matchers also apply to resources and prompts when the rule
+            # has no matcher of their own (legacy compatibility)
+            if rule.resources:
+                self._add_resource_matcher(rule.resources, ordinal)
+            elif rule.tools:
+                self._add_tool_matcher(self._tries["resources"], rule.tools, ordinal)
+
+            if rule.prompts:
+                self._add_prompt_matcher(rule.prompts, ordinal)
+            elif rule.tools:
+                self._add_tool_matcher(self._tries["prompts"], rule.tools, ordinal)
+
+    @staticmethod
+    def _key(value: str) -> str:
+        # fnmatch compares through normcase, so the index must as well
+        return os.path.normcase(value)
+
+    def _add_actions(self, actions: list[str], ordinal: int):
+        if any(c in action for action in actions for c in _GLOB_CHARS):
+            self._any_action.add(ordinal)
+            return
+        for action in actions:
+            self._by_action.setdefault(self._key(action), set()).add(ordinal)
+
+    def _add_names(self, trie: _SegmentTrie, names, patterns, ordinal: int) -> bool:
+        if names:
+            for name in names:
+                trie.add_exact(self._key(name), ordinal)
+        elif patterns:
+            for pattern in patterns:
+                trie.add_pattern(self._key(pattern), ordinal)
+        else:
+            return False
+        return True
+
+    def _add_tool_matcher(self, trie: _SegmentTrie, matcher, ordinal: int):
+        if not self._add_names(trie, matcher.names, matcher.patterns, ordinal):
+            trie.add_prefix("", ordinal)
+
+    def _add_resource_matcher(self, matcher, ordinal: int):
+        trie = self._tries["resources"]
+        if self._add_names(trie, matcher.uris, matcher.patterns, ordinal):
+            return
+        if matcher.schemes and "" not in matcher.schemes:
+            for scheme in matcher.schemes:
+                trie.add_prefix(self._key(f"{scheme}://"), ordinal)
+        else:
+            trie.add_prefix("", ordinal)
+
+    def _add_prompt_matcher(self, matcher, ordinal: int):
+        trie = self._tries["prompts"]
+        if not self._add_names(trie, matcher.names, matcher.patterns, ordinal):
+            trie.add_prefix("", ordinal)
+
+    def candidates(
+        self, resource_type: str, name: str, action: str | None = None
+    ) -> list[PolicyRule]:
+        """
+        Get the rules that may match a capability, in evaluation order.
+
+        Args:
+            resource_type: Type of capability (tools, resources, prompts)
+            name: Capability name or resource URI
+            action: Action being performed; None keeps rules for every action
+
+        Returns:
+            Candidate rules
+        """
+        found = set(self._unrestricted)
+        trie = self._tries.get(resource_type)
+        if trie is not None:
+            trie.lookup(self._key(name), found)
+        if action is not None:
+            literal = self._by_action.get(self._key(action))
+            found &= self._any_action | literal if literal else self._any_action
+        return [self.rules[ordinal] for ordinal in sorted(found)]
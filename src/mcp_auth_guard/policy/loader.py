@@ -1,23 +1,45 @@
 """Policy loader for loading policies from YAML files."""
 
 import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import yaml
 
 from ..schemas.policy import PolicyConfig
 
+try:
+    # libyaml bindings parse in C; PyYAML may be built without them
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 logger = logging.getLogger(__name__)
 
 
 class PolicyLoader:
     """Loads policies from YAML files or dictionaries."""
 
+    # Parsed file contents keyed by resolved path, stored with the
+    # (mtime_ns, size) they were parsed from so edited files are re-read.
+    # Validating the cached data on each hit is cheaper than deep-copying a
+    # validated policy, and gives every caller its own object.
+    _cache: "OrderedDict[str, tuple[int, int, dict]]" = OrderedDict()
+    _cache_max_size = 100
+    _cache_lock = threading.Lock()
+
     @staticmethod
     def load_from_file(file_path: str | Path) -> PolicyConfig:
         """
         Load a single policy from a YAML file.
 
+        Unchanged files are not parsed again; their cached contents are
+        validated into a new policy on each call, since the policy engine
+        sorts rules in place.
+
         Args:
             file_path: Path to the YAML policy file
 
@@ -29,9 +51,18 @@ class PolicyLoader:
         if not file_path.exists():
             raise FileNotFoundError(f"Policy file not found: {file_path}")
 
+        stat = file_path.stat()
+        cache_key = str(file_path.resolve())
+        with PolicyLoader._cache_lock:
+            cached = PolicyLoader._cache.get(cache_key)
+            if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+                PolicyLoader._cache.move_to_end(cache_key)
+                logger.debug(f"Using cached contents of {file_path}")
+                return PolicyConfig.model_validate(cached[2])
+
         try:
             with open(file_path, encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=SafeLoader)
 
             # Validate and parse the policy
             if isinstance(data.get("default_effect"), str):
@@ -40,6 +71,12 @@ class PolicyLoader:
                 data["default_effect"] = Effect(data["default_effect"].lower())
             policy = PolicyConfig.model_validate(data)
 
+            with PolicyLoader._cache_lock:
+                PolicyLoader._cache[cache_key] = (stat.st_mtime_ns, stat.st_size, data)
+                PolicyLoader._cache.move_to_end(cache_key)
+                while len(PolicyLoader._cache) > PolicyLoader._cache_max_size:
+                    PolicyLoader._cache.popitem(last=False)
+
             logger.info(f"Loaded policy '{policy.name}' from {file_path}")
             return policy
 
@@ -70,17 +107,36 @@ class PolicyLoader:
         policies = []
         yaml_files = list(directory.glob("*.yaml")) + list(directory.glob("*.yml"))
 
-        for file_path in yaml_files:
+        def load(file_path: Path) -> PolicyConfig | Exception:
             try:
-                policy = PolicyLoader.load_from_file(file_path)
-                policies.append(policy)
+                return PolicyLoader.load_from_file(file_path)
             except Exception as e:
-                logger.error(f"Failed to load policy from {file_path}: {e}")
+                return e
+
+        # Files are read and parsed in parallel; results keep glob order
+        if len(yaml_files) > 1:
+            workers = min(len(yaml_files), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(load, yaml_files))
+        else:
+            results = [load(file_path) for file_path in yaml_files]
+
+        for file_path, result in zip(yaml_files, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to load policy from {file_path}: {result}")
                 # Continue loading other files
+            else:
+                policies.append(result)
 
         logger.info(f"Loaded {len(policies)} policies from {directory}")
         return policies
 
+    @staticmethod
+    def clear_cache():
+        """Drop all cached file parses."""
+        with PolicyLoader._cache_lock:
+            PolicyLoader._cache.clear()
+
     @staticmethod
     def load_from_dict(data: dict) -> PolicyConfig:
         """
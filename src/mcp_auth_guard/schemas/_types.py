@@ -0,0 +1,11 @@
+"""Shared field types for schema models."""
+
+import sys
+from typing import Annotated
+
+from pydantic import AfterValidator
+
+# Roles, tags and namespaces come from a small vocabulary that is compared on
+# every request; interning makes equal values share one object, so equality
+# and set membership usually end at the identity check
+InternedStr = Annotated[str, AfterValidator(sys.intern)]
@@ -4,6 +4,8 @@ from enum import Enum
 from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, Field
 
+from ._types import InternedStr
+
 
 class AuthMethod(str, Enum):
     """Supported authentication methods."""
@@ -23,7 +25,7 @@ class AuthConfig(BaseModel):
     
     api_key_header: str = Field("X-API-Key", description="Header name for API key")
     api_keys: Optional[List[str]] = Field(None, description="Valid API keys")
-    api_key_roles: Optional[Dict[str, List[str]]] = Field(
+    api_key_roles: Optional[Dict[str, List[InternedStr]]] = Field(
         None, 
         description="Mapping of API keys to their allowed roles"
     )
@@ -42,9 +44,32 @@ class AuthConfig(BaseModel):
 class AuthContext(BaseModel):
     """Authentication context for a request."""
     user_id: Optional[str] = Field(None, description="Authenticated user ID")
-    roles: List[str] = Field(default_factory=list, description="User roles")
+    roles: List[InternedStr] = Field(default_factory=list, description="User roles")
     claims: Dict[str, Any] = Field(default_factory=dict, description="JWT claims or metadata")
     agent_id: Optional[str] = Field(None, description="Agent identifier")
     session_id: Optional[str] = Field(None, description="Session identifier")
     authenticated: bool = Field(False, description="Whether user is authenticated")
     auth_method: Optional[AuthMethod] = Field(None, description="Method used for authentication")
+    
+    # Contexts are cached and shared between requests
+    model_config = {"frozen": True}
+
+    @classmethod
+    def trusted(cls, **data: Any) -> "AuthContext":
+        """
+        Build a context from values the package produced itself, skipping validation.
+
+        Use only for data that already has the field types (configuration
+        that was validated on load, or strings read from headers); anything
+        taken from a client-supplied payload such as JWT claims must go
+        through normal validation.
+
+        Args:
+            **data: Field values; roles may be any iterable of strings
+
+        Returns:
+            AuthContext with unset fields at their defaults
+        """
+        if "roles" in data:
+            data["roles"] = list(data["roles"])
+        return cls.model_construct(**data)
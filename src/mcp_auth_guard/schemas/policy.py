@@ -4,6 +4,8 @@ from enum import Enum
 from typing import Any, Dict, List, Optional, Union
 from pydantic import BaseModel, Field
 
+from ._types import InternedStr
+
 
 class Effect(str, Enum):
     """Policy effect options."""
@@ -38,7 +40,7 @@ class PolicyCondition(BaseModel):
 class AgentMatcher(BaseModel):
     """Matches agents based on various criteria."""
     user_id: Optional[Union[str, List[str]]] = Field(None, description="User ID(s) to match")
-    roles: Optional[List[str]] = Field(None, description="Roles to match")
+    roles: Optional[List[InternedStr]] = Field(None, description="Roles to match")
     agent_id: Optional[Union[str, List[str]]] = Field(None, description="Agent ID(s) to match")
     patterns: Optional[List[str]] = Field(None, description="Wildcard patterns to match")
 
@@ -47,8 +49,8 @@ class ToolMatcher(BaseModel):
     """Matches tools based on various criteria."""
     names: Optional[List[str]] = Field(None, description="Exact tool names to match")
     patterns: Optional[List[str]] = Field(None, description="Wildcard patterns to match")
-    namespaces: Optional[List[str]] = Field(None, description="Tool namespaces to match")
-    tags: Optional[List[str]] = Field(None, description="Tool tags to match")
+    namespaces: Optional[List[InternedStr]] = Field(None, description="Tool namespaces to match")
+    tags: Optional[List[InternedStr]] = Field(None, description="Tool tags to match")
 
 
 class ResourceMatcher(BaseModel):
@@ -62,7 +64,7 @@ class PromptMatcher(BaseModel):
     """Matches prompts based on various criteria.""" 
     names: Optional[List[str]] = Field(None, description="Exact prompt names to match")
     patterns: Optional[List[str]] = Field(None, description="Wildcard patterns to match prompt names")
-    tags: Optional[List[str]] = Field(None, description="Prompt tags to match")
+    tags: Optional[List[InternedStr]] = Field(None, description="Prompt tags to match")
 
 
 class PolicyRule(BaseModel):
@@ -3,16 +3,20 @@
 from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, Field
 
+from ._types import InternedStr
+
 
 class ToolResource(BaseModel):
     """Represents an MCP tool resource."""
     name: str = Field(..., description="Tool name")
-    namespace: Optional[str] = Field(None, description="Tool namespace")
+    namespace: Optional[InternedStr] = Field(None, description="Tool namespace")
     version: Optional[str] = Field(None, description="Tool version")
     description: Optional[str] = Field(None, description="Tool description")
-    tags: List[str] = Field(default_factory=list, description="Tool tags")
+    tags: List[InternedStr] = Field(default_factory=list, description="Tool tags")
     arguments: Dict[str, Any] = Field(default_factory=dict, description="Tool arguments")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
+    
+    model_config = {"frozen": True}
 
 
 class ResourceContext(BaseModel):
@@ -26,4 +30,4 @@ class ResourceContext(BaseModel):
     request_id: Optional[str] = Field(None, description="Request identifier")
     timestamp: Optional[float] = Field(None, description="Request timestamp")
     
-    model_config = {"arbitrary_types_allowed": True}
+    model_config = {"frozen": True}
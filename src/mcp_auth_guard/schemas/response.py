@@ -26,3 +26,6 @@ class AuthDecision(BaseModel):
     # Debugging info
     evaluated_rules: int = Field(0, description="Number of rules evaluated")
     evaluation_time_ms: Optional[float] = Field(None, description="Evaluation time in milliseconds")
+    
+    # Decisions are cached and shared between requests
+    model_config = {"frozen": True}
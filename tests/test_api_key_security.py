@@ -115,3 +115,40 @@ class TestAPIKeyRoleSecurity:
         context = await auth.authenticate(headers)
         
         assert set(context.roles) == {"user", "moderator", "analyst"}
+
+    @pytest.mark.asyncio
+    async def test_context_reused_without_identity_headers(self, secure_config):
+        """Test that a key's context is shared unless identity headers override it."""
+        auth = APIKeyAuthenticator(secure_config)
+        
+        first = await auth.authenticate({"x-api-key": "user-key"})
+        second = await auth.authenticate({"x-api-key": "user-key", "x-user-roles": "admin"})
+        assert first is second
+        assert second.roles == ["user"]
+        
+        override = await auth.authenticate({"x-api-key": "user-key", "x-user-id": "alice"})
+        assert override is not first
+        assert override.user_id == "alice"
+        assert override.agent_id == first.agent_id == "api_key_agent"
+
+    @pytest.mark.asyncio
+    async def test_invalidated_key_is_rejected(self, secure_config):
+        """Test that revoking a key drops its cached context."""
+        auth = APIKeyAuthenticator(secure_config)
+        await auth.authenticate({"x-api-key": "user-key"})
+        
+        assert auth.invalidate("user-key")
+        assert not auth.invalidate("user-key")
+        with pytest.raises(ValueError, match="Invalid API key"):
+            await auth.authenticate({"x-api-key": "user-key"})
+        assert (await auth.authenticate({"x-api-key": "admin-key"})).roles == ["admin"]
+
+    def test_sync_path_shares_cached_context(self, secure_config):
+        """Test that authenticate_sync needs no event loop and reuses contexts."""
+        auth = APIKeyAuthenticator(secure_config)
+        
+        context = auth.authenticate_sync({"x-api-key": "admin-key"})
+        assert context is auth.authenticate_sync({"x-api-key": "admin-key"})
+        assert context.roles == ["admin"]
+        with pytest.raises(ValueError, match="Invalid API key"):
+            auth.authenticate_sync({"x-api-key": "wrong-key"})
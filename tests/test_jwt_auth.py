@@ -0,0 +1,89 @@
+"""Tests for JWT authentication and the verified payload cache."""
+
+import time
+
+import jwt
+import pytest
+from mcp_auth_guard.identity.jwt_auth import JWTAuthenticator
+from mcp_auth_guard.schemas.auth import AuthConfig, AuthMethod
+
+
+SECRET = "test-secret-key-that-is-long-enough-for-hs256"
+
+
+@pytest.fixture
+def authenticator():
+    """JWT authenticator with an HMAC secret."""
+    return JWTAuthenticator(AuthConfig(method=AuthMethod.JWT, jwt_secret=SECRET))
+
+
+def bearer(**claims):
+    return {"authorization": f"Bearer {jwt.encode(claims, SECRET, algorithm='HS256')}"}
+
+
+class TestJWTPayloadCache:
+    """Test reuse of verified JWT payloads."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_token_is_verified_once(self, authenticator, monkeypatch):
+        """Test that a reused token skips signature verification."""
+        headers = bearer(sub="alice", roles="admin", exp=int(time.time()) + 60)
+        first = await authenticator.authenticate(headers)
+
+        def fail_decode(*args, **kwargs):
+            raise AssertionError("token should not be verified again")
+
+        monkeypatch.setattr("mcp_auth_guard.identity.jwt_auth.jwt.decode", fail_decode)
+        second = await authenticator.authenticate({**headers, "x-agent-id": "agent-1"})
+
+        assert first.user_id == second.user_id == "alice"
+        assert second.roles == ["admin"]
+        assert second.agent_id == "agent-1"
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_verified_again(self, authenticator):
+        """Test that a cached payload is not used past the token's expiry."""
+        headers = bearer(sub="alice", exp=int(time.time()) + 60)
+        await authenticator.authenticate(headers)
+
+        key = next(iter(authenticator._payload_cache))
+        payload = authenticator._payload_cache[key][1]
+        authenticator._payload_cache[key] = (time.time() - 1, payload)
+
+        await authenticator.authenticate(headers)
+        assert authenticator._payload_cache[key][0] > time.time()
+
+    @pytest.mark.asyncio
+    async def test_invalid_token_is_not_cached(self, authenticator):
+        """Test that failed verifications are not remembered."""
+        with pytest.raises(ValueError):
+            await authenticator.authenticate({"authorization": "Bearer not-a-token"})
+        assert not authenticator._payload_cache
+
+    @pytest.mark.asyncio
+    async def test_invalidated_token_is_verified_again(self, authenticator):
+        """Test that invalidating a token forgets its cached payload."""
+        headers = bearer(sub="alice", exp=int(time.time()) + 60)
+        await authenticator.authenticate(headers)
+
+        token = headers["authorization"].split(" ", 1)[1]
+        assert authenticator.invalidate(token)
+        assert not authenticator._payload_cache
+        assert not authenticator.invalidate(token)
+
+
+class TestJWTRequiredClaims:
+    """Test required claim validation."""
+
+    @pytest.mark.asyncio
+    async def test_all_missing_claims_are_reported(self):
+        """Test that every missing required claim is named in the error."""
+        authenticator = JWTAuthenticator(
+            AuthConfig(
+                method=AuthMethod.JWT,
+                jwt_secret=SECRET,
+                required_claims=["sub", "tenant", "scope"],
+            )
+        )
+        with pytest.raises(ValueError, match="Missing required claims: scope, tenant"):
+            await authenticator.authenticate(bearer(sub="alice"))
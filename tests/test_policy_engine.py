@@ -0,0 +1,271 @@
+"""Tests for policy engine rule dispatch."""
+
+import pytest
+from mcp_auth_guard.policy.engine import PolicyEngine
+from mcp_auth_guard.schemas.auth import AuthContext, AuthMethod
+from mcp_auth_guard.schemas.policy import PolicyConfig
+from mcp_auth_guard.schemas.resource import ResourceContext, ToolResource
+from mcp_auth_guard.schemas.response import DecisionReason
+
+
+@pytest.fixture
+def engine():
+    """Engine with exact, pattern, scheme and unrestricted rules."""
+    policy = PolicyConfig(
+        name="dispatch",
+        default_effect="deny",
+        rules=[
+            {
+                "name": "deny_delete",
+                "effect": "deny",
+                "tools": {"patterns": ["*delete*"]},
+                "priority": 900,
+            },
+            {
+                "name": "allow_user_tools",
+                "effect": "allow",
+                "tools": {"patterns": ["get_user*"]},
+                "priority": 500,
+            },
+            {
+                "name": "allow_public_info",
+                "effect": "allow",
+                "tools": {"names": ["public_info"]},
+                "priority": 500,
+            },
+            {
+                "name": "allow_user_scheme",
+                "effect": "allow",
+                "resources": {"schemes": ["user"]},
+                "priority": 500,
+            },
+            {
+                "name": "allow_select",
+                "effect": "allow",
+                "tools": {"names": ["query_database"]},
+                "conditions": [
+                    {"field": "tool.args.sql", "operator": "starts_with", "value": "SELECT"}
+                ],
+                "priority": 500,
+            },
+            {
+                "name": "allow_admin",
+                "effect": "allow",
+                "agents": {"roles": ["admin"]},
+                "priority": 100,
+            },
+        ],
+    )
+    return PolicyEngine([policy])
+
+
+def auth(*roles):
+    return AuthContext(
+        authenticated=True,
+        auth_method=AuthMethod.API_KEY,
+        user_id="tester",
+        roles=list(roles),
+    )
+
+
+def resource(resource_type, name):
+    action = {"tools": "call", "resources": "read", "prompts": "get"}[resource_type]
+    return ResourceContext(
+        resource_type=resource_type,
+        resource=ToolResource(name=name),
+        action=action,
+        method=f"{resource_type}/{action}",
+    )
+
+
+class TestRuleDispatch:
+    """Test that indexed dispatch keeps first-match priority semantics."""
+
+    @pytest.mark.asyncio
+    async def test_higher_priority_deny_wins(self, engine):
+        """Test that a matching pattern deny beats a lower allow."""
+        decision = await engine.evaluate(auth("admin"), resource("tools", "delete_user"))
+        assert not decision.allowed
+        assert decision.matched_rule == "deny_delete"
+
+    @pytest.mark.asyncio
+    async def test_only_candidate_rules_are_evaluated(self, engine):
+        """Test that rules for other names are skipped."""
+        decision = await engine.evaluate(auth(), resource("tools", "public_info"))
+        assert decision.matched_rule == "allow_public_info"
+        # deny_delete (root pattern) and allow_public_info; get_user* is pruned
+        assert decision.evaluated_rules == 2
+
+    @pytest.mark.asyncio
+    async def test_prefix_pattern_matches_longer_name(self, engine):
+        """Test that a literal-prefix pattern reaches names below it."""
+        decision = await engine.evaluate(auth(), resource("tools", "get_user_info"))
+        assert decision.matched_rule == "allow_user_tools"
+
+    @pytest.mark.asyncio
+    async def test_scheme_and_unrestricted_rules(self, engine):
+        """Test scheme dispatch and fallthrough to rules without matchers."""
+        decision = await engine.evaluate(auth(), resource("resources", "user://profile"))
+        assert decision.matched_rule == "allow_user_scheme"
+
+        decision = await engine.evaluate(auth("admin"), resource("resources", "admin://config"))
+        assert decision.matched_rule == "allow_admin"
+
+        decision = await engine.evaluate(auth(), resource("resources", "admin://config"))
+        assert not decision.allowed
+        assert decision.reason == DecisionReason.DEFAULT_EFFECT
+
+    @pytest.mark.asyncio
+    async def test_index_tracks_policy_changes(self, engine):
+        """Test that added and removed policies are reflected in dispatch."""
+        engine.add_policy(
+            PolicyConfig(
+                name="extra",
+                rules=[
+                    {
+                        "name": "allow_reports",
+                        "effect": "allow",
+                        "prompts": {"names": ["admin_report"]},
+                    }
+                ],
+            )
+        )
+        decision = await engine.evaluate(auth(), resource("prompts", "admin_report"))
+        assert decision.matched_rule == "allow_reports"
+
+        assert engine.get_policy("extra").name == "extra"
+
+        assert engine.remove_policy("extra")
+        assert engine.get_policy("extra") is None
+        assert not engine.remove_policy("extra")
+        decision = await engine.evaluate(auth(), resource("prompts", "admin_report"))
+        assert decision.reason == DecisionReason.DEFAULT_EFFECT
+
+    @pytest.mark.asyncio
+    async def test_decisions_are_cached_until_policies_change(self, engine):
+        """Test that repeated requests reuse decisions until a policy is added."""
+        first = await engine.evaluate(auth(), resource("tools", "public_info"))
+        cached = await engine.evaluate(auth(), resource("tools", "public_info"))
+        assert cached.matched_rule == first.matched_rule == "allow_public_info"
+        # A cache hit evaluates no rules and reports its own timing
+        assert first.evaluated_rules == 2
+        assert cached.evaluated_rules == 0
+        assert cached is not first
+
+        conditional = resource("tools", "query_database")
+        await engine.evaluate(auth(), conditional)
+        assert (await engine.evaluate(auth(), conditional)).evaluated_rules > 0
+
+        engine.add_policy(PolicyConfig(name="extra", rules=[]))
+        assert (await engine.evaluate(auth(), resource("tools", "public_info"))).evaluated_rules == 2
+
+    @pytest.mark.asyncio
+    async def test_rules_for_other_actions_are_skipped(self, engine):
+        """Test that literal actions prune rules and glob actions are kept."""
+        engine.add_policy(
+            PolicyConfig(
+                name="actions",
+                rules=[
+                    {"name": "list_only", "effect": "allow", "actions": ["list"]},
+                    {"name": "any_c", "effect": "deny", "actions": ["c*"], "priority": 50},
+                ],
+            )
+        )
+        decision = await engine.evaluate(auth(), resource("tools", "public_info"))
+        assert decision.matched_rule == "allow_public_info"
+        assert decision.evaluated_rules == 2
+
+        decision = await engine.evaluate(auth(), resource("tools", "other"))
+        assert decision.matched_rule == "any_c"
+        # deny_delete, allow_admin and any_c; list_only is pruned
+        assert decision.evaluated_rules == 3
+
+    def test_vocabulary_strings_are_interned(self, engine):
+        """Test that request roles and matcher roles share one object."""
+        matcher_role = engine.get_policy("dispatch").rules[-1].agents.roles[0]
+        request_role = auth("".join(["ad", "min"])).roles[0]
+        assert request_role is matcher_role
+
+    def test_conditional_capabilities_are_not_cacheable(self, engine):
+        """Test that only condition-free capabilities allow decision reuse."""
+        assert engine.is_cacheable("tools", "public_info")
+        assert not engine.is_cacheable("tools", "query_database")
+
+    @pytest.mark.asyncio
+    async def test_batch_matches_single_evaluation(self, engine):
+        """Test that batch evaluation agrees with one-at-a-time evaluation."""
+        contexts = [
+            resource("tools", "delete_user"),
+            resource("tools", "get_user_info"),
+            resource("resources", "admin://config"),
+        ]
+        batch = await engine.evaluate_batch(auth(), contexts)
+        single = [await engine.evaluate(auth(), context) for context in contexts]
+
+        assert [d.matched_rule for d in batch] == [d.matched_rule for d in single]
+        assert [d.allowed for d in batch] == [False, True, False]
+
+        unauthenticated = AuthContext(authenticated=False, auth_method=AuthMethod.API_KEY)
+        denied = await engine.evaluate_batch(unauthenticated, contexts)
+        assert [d.reason for d in denied] == [DecisionReason.AUTHENTICATION_FAILED] * 3
+
+
+class TestCompiledPatterns:
+    """Test that precompiled globs keep fnmatch semantics."""
+
+    @pytest.mark.asyncio
+    async def test_action_and_agent_globs(self):
+        """Test glob actions, agent patterns and empty action lists."""
+        policy = PolicyConfig(
+            name="globs",
+            rules=[
+                {"name": "never", "effect": "allow", "actions": [], "priority": 900},
+                {
+                    "name": "testers_call",
+                    "effect": "allow",
+                    "actions": ["c?ll"],
+                    "agents": {"user_id": "test*"},
+                    "tools": {"patterns": ["get_*"]},
+                },
+            ],
+        )
+        engine = PolicyEngine([policy])
+
+        decision = await engine.evaluate(auth(), resource("tools", "get_weather"))
+        assert decision.matched_rule == "testers_call"
+
+        decision = await engine.evaluate(auth(), resource("tools", "set_weather"))
+        assert decision.reason == DecisionReason.DEFAULT_EFFECT
+
+        other = AuthContext(authenticated=True, auth_method=AuthMethod.API_KEY, user_id="bob")
+        decision = await engine.evaluate(other, resource("tools", "get_weather"))
+        assert decision.reason == DecisionReason.DEFAULT_EFFECT
+
+    @pytest.mark.asyncio
+    async def test_condition_context_built_once_per_request(self, monkeypatch):
+        """Test that conditional rules share one evaluation context."""
+        policy = PolicyConfig(
+            name="conditions",
+            rules=[
+                {
+                    "name": f"needs_{field}",
+                    "effect": "allow",
+                    "conditions": [{"field": field, "operator": "equals", "value": "x"}],
+                }
+                for field in ("user.id", "tool.name")
+            ],
+        )
+        engine = PolicyEngine([policy])
+        built = []
+        build = engine.evaluator._build_evaluation_context
+
+        def counting_build(*args):
+            built.append(args)
+            return build(*args)
+
+        monkeypatch.setattr(engine.evaluator, "_build_evaluation_context", counting_build)
+        decision = await engine.evaluate(auth(), resource("tools", "x"))
+
+        assert decision.matched_rule == "needs_tool.name"
+        assert decision.evaluated_rules == 2
+        assert len(built) == 1
@@ -0,0 +1,103 @@
+"""Tests for policy loading and the parsed-file cache."""
+
+import os
+
+import pytest
+from mcp_auth_guard.policy.loader import PolicyLoader
+
+
+POLICY_YAML = """\
+name: {name}
+default_effect: deny
+rules:
+  - name: admin_access
+    effect: allow
+    agents:
+      roles: ["admin"]
+    priority: 1000
+"""
+
+
+@pytest.fixture(autouse=True)
+def clear_loader_cache():
+    """Isolate tests from each other's cached parses."""
+    PolicyLoader.clear_cache()
+    yield
+    PolicyLoader.clear_cache()
+
+
+def write_policy(path, name):
+    path.write_text(POLICY_YAML.format(name=name), encoding="utf-8")
+
+
+class TestPolicyLoaderCache:
+    """Test caching of parsed policy files."""
+
+    def test_unchanged_file_served_from_cache(self, tmp_path, monkeypatch):
+        """Test that an unchanged file is not parsed twice."""
+        policy_file = tmp_path / "policy.yaml"
+        write_policy(policy_file, "cached")
+
+        first = PolicyLoader.load_from_file(policy_file)
+
+        def fail_parse(*args, **kwargs):
+            raise AssertionError("YAML should not be parsed again")
+
+        monkeypatch.setattr("mcp_auth_guard.policy.loader.yaml.load", fail_parse)
+        second = PolicyLoader.load_from_file(policy_file)
+
+        assert second.name == first.name == "cached"
+
+    def test_cached_policy_is_a_copy(self, tmp_path):
+        """Test that mutating a loaded policy does not leak into the cache."""
+        policy_file = tmp_path / "policy.yaml"
+        write_policy(policy_file, "copy")
+
+        first = PolicyLoader.load_from_file(policy_file)
+        first.rules.clear()
+
+        second = PolicyLoader.load_from_file(policy_file)
+        assert first is not second
+        assert len(second.rules) == 1
+
+    def test_modified_file_is_reloaded(self, tmp_path):
+        """Test that a changed file invalidates its cache entry."""
+        policy_file = tmp_path / "policy.yaml"
+        write_policy(policy_file, "before")
+        assert PolicyLoader.load_from_file(policy_file).name == "before"
+
+        write_policy(policy_file, "after_edit")
+        stat = policy_file.stat()
+        os.utime(policy_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert PolicyLoader.load_from_file(policy_file).name == "after_edit"
+
+    def test_cache_is_bounded(self, tmp_path, monkeypatch):
+        """Test that the least recently used entry is evicted."""
+        monkeypatch.setattr(PolicyLoader, "_cache_max_size", 2)
+        for name in ("one", "two", "three"):
+            write_policy(tmp_path / f"{name}.yaml", name)
+            PolicyLoader.load_from_file(tmp_path / f"{name}.yaml")
+
+        cached = [entry[2]["name"] for entry in PolicyLoader._cache.values()]
+        assert cached == ["two", "three"]
+
+
+class TestPolicyLoaderDirectory:
+    """Test loading every policy file in a directory."""
+
+    def test_loads_in_glob_order_and_skips_bad_files(self, tmp_path):
+        """Test that parallel loading keeps order and tolerates errors."""
+        names = [f"policy_{i}" for i in range(6)]
+        for name in names:
+            write_policy(tmp_path / f"{name}.yaml", name)
+        (tmp_path / "broken.yml").write_text("rules: [", encoding="utf-8")
+
+        expected = [
+            path.stem
+            for path in list(tmp_path.glob("*.yaml")) + list(tmp_path.glob("*.yml"))
+            if path.stem != "broken"
+        ]
+        policies = PolicyLoader.load_from_directory(tmp_path)
+
+        assert [p.name for p in policies] == expected
@@ -1,11 +1,18 @@
 #!/usr/bin/env python
 """Standalone policy validator."""
 
+import sys
 import yaml
 from typing import Any, Dict, List, Optional, Union
-from pydantic import BaseModel, Field, ValidationError
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
 from enum import Enum
 
+try:
+    # libyaml bindings parse in C; PyYAML may be built without them
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 
 class Effect(str, Enum):
     """Policy effect options."""
@@ -88,14 +95,22 @@ class PolicyConfig(BaseModel):
     model_config = {"use_enum_values": True}
 
 
+# Built once and shared by every file validated in this process
+_POLICY_ADAPTER = TypeAdapter(PolicyConfig)
+
+
 def validate_policy_file(filepath: str):
-    """Validate a policy YAML file."""
+    """Validate a policy YAML (or JSON) file."""
     try:
-        with open(filepath, 'r') as f:
-            policy_data = yaml.safe_load(f)
-        
-        # Validate against schema
-        policy = PolicyConfig.model_validate(policy_data)
+        with open(filepath, 'rb') as f:
+            if filepath.endswith('.json'):
+                # pydantic parses and validates JSON in one pass
+                policy = _POLICY_ADAPTER.validate_json(f.read())
+            else:
+                policy_data = yaml.load(f, Loader=SafeLoader)
+                
+                # Validate against schema
+                policy = _POLICY_ADAPTER.validate_python(policy_data)
         print(f'✅ Policy file "{filepath}" is valid!')
         print(f'Policy: {policy.name}')
         print(f'Rules: {len(policy.rules)}')
@@ -113,5 +128,12 @@ def validate_policy_file(filepath: str):
         return False
 
 
+def validate_policy_files(paths: List[str]) -> bool:
+    """Validate several policy YAML files, reporting on each one."""
+    results = [validate_policy_file(path) for path in paths]
+    return all(results)
+
+
 if __name__ == "__main__":
-    validate_policy_file("examples/weather_policies.yaml")
+    paths = sys.argv[1:] or ["examples/weather_policies.yaml"]
+    sys.exit(0 if validate_policy_files(paths) else 1)